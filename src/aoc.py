@@ -1,78 +1,707 @@
 # Standard Library
 import contextlib
+import gc
+import sys
+from collections import Counter, defaultdict
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from importlib import import_module
 from pathlib import Path
-from statistics import mean
-from time import time
+from time import perf_counter_ns, sleep
+from types import ModuleType
+from typing import Any, Generic, Self, TypeVar
 
 # First Party
-from utils import read_input
+from utils import input_path, read_input
 
 # Third Party
 import typer
-from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table
+
+# Anything heavier than the above is imported where it is used to keep startup fast, see `startup-time`
 
 app = typer.Typer()
 
+HISTORY = Path("./.benchmarks/history.jsonl")
+ANSWER_CACHE = Path("./.cache/answers")
+
+T = TypeVar("T")
+Unit = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class Outcome(Generic[T]):
+    status: str
+    value: T | None = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "OK"
+
+    def __str__(self) -> str:
+        return f"{self.value}" if self.ok else self.status
+
+
+def attempt(func: Callable[..., T], day: str, part: int) -> Outcome[T]:
+    try:
+        return Outcome("OK", func(day, part))
+    except MemoryError:
+        return Outcome("MEMORY", error="MemoryError")
+    except Exception as e:
+        return Outcome("ERROR", error=f"{type(e).__name__}: {e}")
+
+
+def supervised(conn: Any, func: Callable[..., T], day: str, part: int, memory_limit: int | None) -> None:
+    if memory_limit is not None:
+        # Standard Library
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    conn.send(attempt(func, day, part))
+    conn.close()
+
+
+def run_units(
+    func: Callable[..., T],
+    units: list[Unit],
+    jobs: int = 1,
+    progress: Callable = lambda: None,
+    fresh: bool = False,
+    timeout: float | None = None,
+    memory_limit: int | None = None,
+) -> dict[Unit, Outcome[T]]:
+    results: dict[Unit, Outcome[T]] = {}
+
+    if jobs <= 1 and not fresh and timeout is None and memory_limit is None:
+        for day, part in units:
+            results[(day, part)] = attempt(func, day, part)
+            progress()
+        return results
+
+    # Standard Library
+    import multiprocessing
+    from multiprocessing.connection import wait
+    from time import monotonic
+
+    context = multiprocessing.get_context("spawn" if fresh else None)
+    pending = list(units)
+    running: dict[Any, tuple[Unit, Any, float]] = {}
+
+    def finish(receiver: Any, outcome: Outcome[T]) -> None:
+        unit, process, _ = running.pop(receiver)
+        process.kill()
+        process.join()
+        receiver.close()
+        results[unit] = outcome
+        progress()
+
+    while pending or running:
+        while pending and len(running) < max(jobs, 1):
+            day, part = pending.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=supervised, args=(sender, func, day, part, memory_limit), daemon=True)
+            process.start()
+            sender.close()
+            running[receiver] = ((day, part), process, float("inf") if timeout is None else monotonic() + timeout)
+
+        deadline = min(d for _, _, d in running.values())
+        for receiver in wait(list(running), timeout=None if deadline == float("inf") else max(deadline - monotonic(), 0)):
+            try:
+                outcome = receiver.recv()
+            except EOFError:
+                _, process, _ = running[receiver]
+                process.join()
+                outcome = Outcome("ERROR", error=f"Worker exited with code {process.exitcode}")
+            finish(receiver, outcome)
+
+        for receiver, (_, _, unit_deadline) in list(running.items()):
+            if monotonic() >= unit_deadline:
+                finish(receiver, Outcome("TIMEOUT", error=f"Took longer than {timeout}s"))
+
+    return results
+
+
+def status_style(outcome: Outcome) -> str:
+    return "" if outcome.ok else "bold red"
+
+
+def print_errors(console: Any, outcomes: dict[Unit, Outcome]) -> None:
+    for (day, part), outcome in sorted(outcomes.items()):
+        if not outcome.ok:
+            console.print(f"[bold red]{day} part {part}: {outcome.status}[/bold red] {outcome.error}")
+
+
+@dataclass(frozen=True)
+class Timing:
+    samples: list[float]
+    loops: int
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        # Standard Library
+        import statistics
+
+        return statistics.median(self.samples)
 
-def time_it(day: str, iterations: int = 1, progress: Callable = lambda: None) -> tuple[float, float]:
+    @property
+    def p95(self) -> float:
+        # Standard Library
+        import statistics
+
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[-1]
+
+    @property
+    def stddev(self) -> float:
+        # Standard Library
+        import statistics
+
+        if len(self.samples) < 2:
+            return 0.0
+        return statistics.stdev(self.samples)
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("µs", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.3f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def time_batch(func: Callable[[], Any], loops: int) -> int:
+    start = perf_counter_ns()
+    for _ in range(loops):
+        func()
+    return perf_counter_ns() - start
+
+
+def calibrate(func: Callable[[], Any], min_time: float) -> int:
+    loops = 1
+    while True:
+        for multiplier in [1, 2, 5]:
+            if time_batch(func, loops * multiplier) >= min_time * 1e9:
+                return loops * multiplier
+        loops *= 10
+
+
+@lru_cache(maxsize=1)
+def load_day(day: str) -> tuple[ModuleType, str, Any]:
     module = import_module(day)
     input_str = read_input(day)
+    parse = getattr(module, "parse", None)
 
-    times: dict[int, list[float]] = {}
+    return module, input_str, input_str if parse is None else parse(input_str)
 
-    for i in [1, 2]:
-        times[i] = []
-        for _ in range(iterations):
-            start = time()
-            with contextlib.suppress(Exception):
-                getattr(module, f"part_{i}")(input_str)
-            times[i].append(time() - start)
-            progress()
 
-    return mean(times[1]), mean(times[2])
+def measure(func: Callable[[], Any], iterations: int = 10, warmup: int = 1, min_time: float = 0.01) -> Timing:
+    loops = calibrate(func, min_time)
+    for _ in range(warmup):
+        time_batch(func, loops)
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples = [time_batch(func, loops) / loops / 1e9 for _ in range(iterations)]
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return Timing(samples, loops)
+
+
+@lru_cache(maxsize=1)
+def time_parse(day: str, iterations: int = 10, warmup: int = 1, min_time: float = 0.01) -> Timing | None:
+    module, input_str, _ = load_day(day)
+    if not hasattr(module, "parse"):
+        return None
+
+    return measure(partial(module.parse, input_str), iterations, warmup, min_time)
+
+
+def streams(day: str, stream: bool) -> bool:
+    return stream and getattr(import_module(day), "STREAMING", False)
+
+
+def stream_part(func: Callable[[Any], T], path: str) -> T:
+    with open(path) as f:
+        return func(f)
+
+
+def part_runner(day: str, part: int, stream: bool = False) -> Callable[[], Any]:
+    func = getattr(import_module(day), f"part_{part}")
+    if streams(day, stream):
+        return partial(stream_part, func, input_path(day))
+
+    _, _, parsed = load_day(day)
+    return partial(func, parsed)
+
+
+def time_it(
+    day: str, part: int, iterations: int = 10, warmup: int = 1, min_time: float = 0.01, stream: bool = False
+) -> tuple[Timing | None, Timing]:
+    func = part_runner(day, part, stream)
+    parse_timing = None if streams(day, stream) else time_parse(day, iterations, warmup, min_time)
+
+    return parse_timing, measure(func, iterations, warmup, min_time)
+
+
+def format_bytes(size: float) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def peak_rss() -> int:
+    # Standard Library
+    import resource
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def rss_it(day: str, part: int, stream: bool = False) -> int:
+    run_day(day, part, stream)
+    return peak_rss()
+
+
+def trace_it(day: str, part: int, stream: bool = False) -> int:
+    # Standard Library
+    import tracemalloc
+
+    # import and parse before tracing starts, so the peak is only what the part itself allocates
+    func = part_runner(day, part, stream)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
 
 
 @app.command()
-def benchmark(iterations: int = 10, days: list[str] = []) -> None:
+def benchmark(
+    iterations: int = 10,
+    days: list[str] = [],
+    jobs: int = typer.Option(1, "--jobs", "-j"),
+    warmup: int = 1,
+    min_time: float = 0.01,
+    save: bool = True,
+    history: Path = HISTORY,
+    memory: bool = typer.Option(False, help="Also measure peak allocations and RSS in fresh processes"),
+    timeout: float = typer.Option(None, help="Wall-clock limit in seconds for each part"),
+    memory_limit: int = typer.Option(None, help="Address space limit in MiB for each part"),
+    stream: bool = typer.Option(False, help="Feed days that set STREAMING an open input file instead of a string"),
+) -> None:
+    # Third Party
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
     table = Table(title=f"AOC 2022 - Timings\n({iterations:,} iterations)")
 
     table.add_column("Day", justify="center", style="bold")
-    table.add_column("Part 1", justify="right")
-    table.add_column("Part 2", justify="right")
+    table.add_column("Part", justify="center")
+    table.add_column("Parse", justify="right")
+    table.add_column("Solve", justify="right")
+    table.add_column("Min", justify="right")
+    table.add_column("P95", justify="right")
+    table.add_column("Stddev", justify="right")
+    table.add_column("Loops", justify="right")
+    if memory:
+        table.add_column("Peak alloc", justify="right")
+        table.add_column("Peak RSS", justify="right")
 
     if not days:
         days = [p.name.replace(".py", "") for p in list(Path("./src").glob("day_*.py"))]
 
+    units = [(day, part) for day in sorted(days) for part in [1, 2]]
+    timer = partial(time_it, iterations=iterations, warmup=warmup, min_time=min_time, stream=stream)
+
+    limits = {"timeout": timeout, "memory_limit": None if memory_limit is None else memory_limit * 1024**2}
+    allocs: dict[Unit, Outcome[int]] = {}
+    rss: dict[Unit, Outcome[int]] = {}
+
     with Progress(transient=True) as progress:
-        task = progress.add_task("Running code", total=(len(days) * 2) * iterations)
-        for day in sorted(days):
-            p1, p2 = time_it(day, iterations, lambda: progress.update(task, advance=1))
+        task = progress.add_task("Running code", total=len(units) * (3 if memory else 1))
+        advance = lambda: progress.update(task, advance=1)  # noqa: E731
+        times = run_units(timer, units, jobs, advance, **limits)
+        if memory:
+            allocs = run_units(partial(trace_it, stream=stream), units, jobs, advance, fresh=True, **limits)
+            rss = run_units(partial(rss_it, stream=stream), units, jobs, advance, fresh=True, **limits)
 
-            _, d = day.split("_")
-            table.add_row(f"{int(d)}", f"{p1:.4f}s", f"{p2:.4f}s")
+    if save:
+        save_history(
+            history,
+            {unit: outcome.value for unit, outcome in times.items() if outcome.value is not None},
+            {unit: outcome.value for unit, outcome in allocs.items() if outcome.value is not None},
+            {unit: outcome.value for unit, outcome in rss.items() if outcome.value is not None},
+            stream,
+        )
+
+    for day, part in units:
+        _, d = day.split("_")
+        outcome = times[(day, part)]
+        if outcome.value is None:
+            row = [outcome.status] * 6
+        else:
+            parse_timing, timing = outcome.value
+            row = [
+                "-" if parse_timing is None else format_time(parse_timing.median),
+                format_time(timing.median),
+                format_time(timing.min),
+                format_time(timing.p95),
+                format_time(timing.stddev),
+                f"{timing.loops:,}",
+            ]
+        if memory:
+            for measured in [allocs[(day, part)], rss[(day, part)]]:
+                row.append(measured.status if measured.value is None else format_bytes(measured.value))
+
+        table.add_row(f"{int(d)}", f"{part}", *row, style=status_style(outcome))
 
     with Console() as console:
         console.print(table)
+        print_errors(console, times)
 
 
-def run_day(day: str, progress: Callable = lambda: None) -> tuple[float, float]:
-    module = import_module(day)
-    input_str = read_input(day)
+def git_commit() -> str:
+    # Standard Library
+    import subprocess
 
-    part_1 = 0
-    part_2 = 0
-    with contextlib.suppress(Exception):
-        part_1 = getattr(module, "part_1")(input_str)
-        progress()
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
 
-        part_2 = getattr(module, "part_2")(input_str)
-        progress()
 
-    return part_1, part_2
+def save_history(
+    history: Path,
+    times: dict[Unit, tuple[Timing | None, Timing]],
+    allocs: dict[Unit, int] = {},
+    rss: dict[Unit, int] = {},
+    stream: bool = False,
+) -> None:
+    # Standard Library
+    import json
+    import platform
+    from datetime import datetime, timezone
+
+    run = datetime.now(timezone.utc).isoformat()
+    commit = git_commit()
+    python = platform.python_version()
+
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, "a") as f:
+        for (day, part), (parse_timing, timing) in sorted(times.items()):
+            record = {
+                "run": run,
+                "commit": commit,
+                "python": python,
+                "stream": stream,
+                "day": day,
+                "part": part,
+                "parse": None if parse_timing is None else parse_timing.median,
+                "min": timing.min,
+                "median": timing.median,
+                "p95": timing.p95,
+                "stddev": timing.stddev,
+                "loops": timing.loops,
+                "samples": len(timing.samples),
+                "peak_alloc": allocs.get((day, part)),
+                "peak_rss": rss.get((day, part)),
+            }
+            f.write(f"{json.dumps(record)}\n")
+
+
+def load_history(history: Path) -> dict[str, list[dict[str, Any]]]:
+    # Standard Library
+    import json
+
+    runs: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    with contextlib.suppress(FileNotFoundError):
+        with open(history) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    runs[record["run"]].append(record)
+
+    return dict(runs)
+
+
+def pick_run(
+    runs: dict[str, list[dict[str, Any]]], commit: str | None, before: str | None = None, stream: bool | None = None
+) -> str:
+    candidates = sorted(run for run in runs if before is None or run < before)
+    if stream is not None:
+        # streamed runs time reading the input too, so they only compare with each other
+        candidates = [run for run in candidates if runs[run][0].get("stream", False) == stream]
+    if commit is not None:
+        candidates = [run for run in candidates if runs[run][0]["commit"].startswith(commit)]
+
+    if not candidates:
+        raise typer.BadParameter(f"No benchmark run found for {commit or 'history'}")
+
+    return candidates[-1]
+
+
+@app.command()
+def compare(
+    baseline: str = typer.Option(None, help="Commit to compare against, defaults to the previous run"),
+    candidate: str = typer.Option(None, help="Commit to check, defaults to the latest run"),
+    threshold: float = typer.Option(0.05, help="Allowed slowdown in the median before failing"),
+    history: Path = HISTORY,
+) -> None:
+    # Third Party
+    from rich.console import Console
+    from rich.table import Table
+
+    runs = load_history(history)
+
+    candidate_run = pick_run(runs, candidate)
+    stream = runs[candidate_run][0].get("stream", False)
+    baseline_run = pick_run(runs, baseline, before=None if baseline else candidate_run, stream=stream)
+
+    python = runs[candidate_run][0]["python"]
+    baseline_medians = {(r["day"], r["part"]): r["median"] for r in runs[baseline_run] if r["python"] == python}
+    candidate_medians = {(r["day"], r["part"]): r["median"] for r in runs[candidate_run]}
+
+    if not baseline_medians:
+        with Console() as console:
+            console.print(f"[bold red]Nothing in the baseline run was timed on Python {python}[/bold red]")
+        raise typer.Exit(code=1)
+
+    table = Table(
+        title=(
+            f"AOC 2022 - Comparison\n"
+            f"({runs[baseline_run][0]['commit']} -> {runs[candidate_run][0]['commit']}, Python {python})"
+        )
+    )
+
+    table.add_column("Day", justify="center", style="bold")
+    table.add_column("Part", justify="center")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Candidate", justify="right")
+    table.add_column("Change", justify="right")
+
+    regressions = 0
+    missing = 0
+    for key in sorted(baseline_medians):
+        day, part = key
+        _, d = day.split("_")
+        before = baseline_medians[key]
+
+        # only OK units are saved, so a part that now errors or times out drops out of the run
+        if key not in candidate_medians:
+            missing += 1
+            table.add_row(f"{int(d)}", f"{part}", format_time(before), "-", "missing", style="bold red")
+            continue
+
+        after = candidate_medians[key]
+        change = (after - before) / before if before else 0.0
+        style = ""
+        if change > threshold:
+            regressions += 1
+            style = "bold red"
+        elif change < -threshold:
+            style = "green"
+
+        table.add_row(f"{int(d)}", f"{part}", format_time(before), format_time(after), f"{change:+.1%}", style=style)
+
+    with Console() as console:
+        console.print(table)
+        if regressions:
+            console.print(f"[bold red]{regressions} regression(s) over {threshold:.0%}[/bold red]")
+        if missing:
+            console.print(f"[bold red]{missing} part(s) missing from the candidate run[/bold red]")
+
+    if regressions or missing:
+        raise typer.Exit(code=1)
+
+
+def frame_label(file: str, line: int, name: str) -> str:
+    if file == "~":
+        return name
+    return f"{name} ({Path(file).name}:{line})"
+
+
+class Sampler:
+    def __init__(self, interval: float = 0.001) -> None:
+        # Standard Library
+        import threading
+
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.thread_id = threading.get_ident()
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def sample(self) -> None:
+        while not self.stop.is_set():
+            sleep(self.interval)
+            frame = sys._current_frames().get(self.thread_id)
+            stack: list[str] = []
+            while frame is not None and frame is not self.root:
+                code = frame.f_code
+                stack.append(frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack and not self.stop.is_set():
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def __enter__(self) -> Self:
+        self.root = sys._getframe(1)
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, self.interval))
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop.set()
+        self.thread.join()
+        sys.setswitchinterval(self.switch_interval)
+
+    def collapsed(self) -> str:
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.items())
+
+
+@app.command()
+def profile(
+    day: int = typer.Option(..., "--day", "-d"),
+    part: int = typer.Option(1, "--part", "-p"),
+    sampling: bool = typer.Option(False, "--sampling", help="Use the sampling profiler instead of cProfile"),
+    interval: float = typer.Option(0.001, help="Seconds between samples when sampling"),
+    top: int = 20,
+    sort: str = typer.Option("tottime", help="cProfile sort key, tottime or cumulative"),
+    output: Path = typer.Option(None, help="Write a .pstats file, or collapsed stacks when sampling"),
+) -> None:
+    # Standard Library
+    import cProfile
+    import pstats
+
+    # Third Party
+    from rich.console import Console
+    from rich.table import Table
+
+    module, _, parsed = load_day(f"day_{day:02}")
+    func = getattr(module, f"part_{part}")
+
+    table = Table(title=f"AOC 2022 - Profile\n(day {day}, part {part}, {'sampling' if sampling else 'cProfile'})")
+    table.add_column("Function", justify="left", style="bold")
+
+    if sampling:
+        with Sampler(interval) as sampler:
+            answer = func(parsed)
+
+        total = sum(sampler.stacks.values()) or 1
+        own: Counter[str] = Counter()
+        inclusive: Counter[str] = Counter()
+        for stack, count in sampler.stacks.items():
+            own[stack[-1]] += count
+            for label in set(stack):
+                inclusive[label] += count
+
+        table.add_column("Samples", justify="right")
+        table.add_column("Own", justify="right")
+        table.add_column("Total", justify="right")
+        for label, count in own.most_common(top):
+            table.add_row(label, f"{count:,}", f"{count / total:.1%}", f"{inclusive[label] / total:.1%}")
+
+        if output is not None:
+            output.write_text(sampler.collapsed())
+    else:
+        profiler = cProfile.Profile()
+        answer = profiler.runcall(func, parsed)
+        stats = pstats.Stats(profiler).sort_stats(sort)
+
+        table.add_column("Calls", justify="right")
+        table.add_column("Own", justify="right")
+        table.add_column("Cumulative", justify="right")
+        table.add_column("Per call", justify="right")
+        for key in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+            _, calls, own_time, cumulative, _ = stats.stats[key]  # type: ignore[attr-defined]
+            table.add_row(
+                frame_label(*key),
+                f"{calls:,}",
+                format_time(own_time),
+                format_time(cumulative),
+                format_time(cumulative / calls),
+            )
+
+        if output is not None:
+            stats.dump_stats(output)
+
+    with Console() as console:
+        console.print(table)
+        console.print(f"Answer: {answer}")
+
+
+def run_day(day: str, part: int, stream: bool = False) -> Any:
+    return part_runner(day, part, stream)()
+
+
+@lru_cache
+def file_hash(path: Path) -> str:
+    # Standard Library
+    import hashlib
+
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def answer_key(day: str, part: int) -> str | None:
+    # Standard Library
+    import hashlib
+
+    src = Path(__file__).parent
+    files = [Path(input_path(day)), src / f"{day}.py", *sorted((src / "utils").glob("*.py"))]
+
+    digest = hashlib.sha256(f"{day}:{part}".encode())
+    try:
+        for file in files:
+            digest.update(file_hash(file).encode())
+    except FileNotFoundError:
+        return None
+
+    return digest.hexdigest()
+
+
+def read_answer(cache: Path, key: str | None) -> Outcome | None:
+    # Standard Library
+    import json
+
+    if key is None:
+        return None
+
+    try:
+        return Outcome("OK", json.loads((cache / f"{key}.json").read_text()))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def write_answer(cache: Path, key: str | None, outcome: Outcome) -> None:
+    # Standard Library
+    import json
+
+    if key is None or not outcome.ok:
+        return
+
+    try:
+        encoded = json.dumps(outcome.value)
+    except TypeError:
+        return
+
+    cache.mkdir(parents=True, exist_ok=True)
+    (cache / f"{key}.json").write_text(encoded)
 
 
 def day_from_name(file_name: str) -> int:
@@ -80,7 +709,20 @@ def day_from_name(file_name: str) -> int:
 
 
 @app.command()
-def answers(days: list[int] = []) -> None:
+def answers(
+    days: list[int] = [],
+    jobs: int = typer.Option(1, "--jobs", "-j"),
+    timeout: float = typer.Option(None, help="Wall-clock limit in seconds for each part"),
+    memory_limit: int = typer.Option(None, help="Address space limit in MiB for each part"),
+    cache: bool = typer.Option(True, help="Reuse answers when the input, day and utils sources are unchanged"),
+    cache_dir: Path = ANSWER_CACHE,
+    stream: bool = typer.Option(False, help="Feed days that set STREAMING an open input file instead of a string"),
+) -> None:
+    # Third Party
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
     table = Table(title="Advent of Code 2022 - Answers")
 
     table.add_column("Day", justify="center", style="bold")
@@ -90,16 +732,403 @@ def answers(days: list[int] = []) -> None:
     if not days:
         days = [day_from_name(p.name) for p in list(Path("./src").glob("day_*.py"))]
 
+    units = [(f"day_{d:02}", part) for d in sorted(days) for part in [1, 2]]
+    keys = {unit: answer_key(*unit) for unit in units}
+
+    results: dict[Unit, Outcome] = {}
+    if cache:
+        for unit in units:
+            if (cached := read_answer(cache_dir, keys[unit])) is not None:
+                results[unit] = cached
+    to_run = [unit for unit in units if unit not in results]
+
     with Progress(transient=True) as progress:
-        task = progress.add_task("Running code", total=(len(days) * 2))
-        for d in sorted(days):
-            p1, p2 = run_day(f"day_{d:02}", lambda: progress.update(task, advance=1))
+        task = progress.add_task("Running code", total=len(to_run))
+        results |= run_units(
+            partial(run_day, stream=stream),
+            to_run,
+            jobs,
+            lambda: progress.update(task, advance=1),
+            timeout=timeout,
+            memory_limit=None if memory_limit is None else memory_limit * 1024**2,
+        )
+
+    for unit in to_run:
+        write_answer(cache_dir, keys[unit], results[unit])
 
-            table.add_row(f"{int(d)}", f"{p1}", f"{p2}")
+    for d in sorted(days):
+        cells = [results[(f"day_{d:02}", part)] for part in [1, 2]]
+        table.add_row(f"{int(d)}", *[f"{c}" if c.ok else f"[{status_style(c)}]{c}[/]" for c in cells])
 
     with Console() as console:
         console.print(table)
+        print_errors(console, results)
+
+
+def load_generator(day: int) -> tuple[ModuleType, Callable[[int, int], str]]:
+    module = import_module(f"day_{day:02}")
+    if not hasattr(module, "generate"):
+        raise typer.BadParameter(f"day {day} has no input generator", param_hint="--day")
+
+    return module, module.generate
+
+
+@app.command()
+def generate(
+    day: int = typer.Option(..., "--day", "-d"),
+    size: int = typer.Option(..., "--size", "-s"),
+    seed: int = 0,
+    output: Path = typer.Option(None, help="Write the input here instead of stdout"),
+) -> None:
+    _, generator = load_generator(day)
+    data = generator(size, seed)
+
+    if output is None:
+        sys.stdout.write(f"{data}\n")
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(data)
+
+
+def fit_complexity(sizes: list[int], seconds: list[float]) -> tuple[str, float]:
+    # Standard Library
+    import math
+    import statistics
+
+    classes: dict[str, Callable[[float], float]] = {
+        "O(1)": lambda n: 1.0,
+        "O(log n)": math.log,
+        "O(n)": lambda n: n,
+        "O(n log n)": lambda n: n * math.log(n),
+        "O(n²)": lambda n: n**2,
+        "O(n³)": lambda n: n**3,
+    }
+
+    def error(complexity: Callable[[float], float]) -> float:
+        scaled = [complexity(n) for n in sizes]
+        factor = sum(s * t for s, t in zip(scaled, seconds)) / sum(s * s for s in scaled)
+        return sum(((factor * s - t) / t) ** 2 for s, t in zip(scaled, seconds))
+
+    best = min(classes, key=lambda name: error(classes[name]))
+    slope, _ = statistics.linear_regression([math.log(n) for n in sizes], [math.log(t) for t in seconds])
+
+    return best, slope
+
+
+@app.command()
+def scale(
+    day: int = typer.Option(..., "--day", "-d"),
+    parts: list[int] = typer.Option([1, 2], "--part", "-p"),
+    sizes: list[int] = typer.Option([100, 200, 400, 800, 1600], "--size", "-s"),
+    seed: int = 0,
+    iterations: int = 5,
+    warmup: int = 1,
+    min_time: float = 0.01,
+) -> None:
+    # Third Party
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
+    sizes = sorted(set(sizes))
+    if len(sizes) < 2 or sizes[0] < 2:
+        raise typer.BadParameter("need at least two sizes of 2 or more", param_hint="--size")
+
+    module, generator = load_generator(day)
+    parse = getattr(module, "parse", None)
+    stages: dict[str, Callable[[Any], Any]] = {} if parse is None else {"Parse": parse}
+    stages |= {f"Part {part}": getattr(module, f"part_{part}") for part in parts}
+
+    timings: dict[str, list[float]] = defaultdict(list)
+    with Progress(transient=True) as progress:
+        task = progress.add_task("Scaling", total=len(sizes) * len(stages))
+        for size in sizes:
+            data = generator(size, seed)
+            parsed = data if parse is None else parse(data)
+            for stage, func in stages.items():
+                argument = data if stage == "Parse" else parsed
+                timing = measure(partial(func, argument), iterations, warmup, min_time)
+                timings[stage].append(timing.median)
+                progress.update(task, advance=1)
+
+    table = Table(title=f"AOC 2022 - Scaling\n(day {day}, seed {seed})")
+    table.add_column("Size", justify="right", style="bold")
+    for stage in stages:
+        table.add_column(stage, justify="right")
+
+    for i, size in enumerate(sizes):
+        table.add_row(f"{size:,}", *[format_time(timings[stage][i]) for stage in stages])
+
+    fits = [fit_complexity(sizes, timings[stage]) for stage in stages]
+    table.add_section()
+    table.add_row("Fit", *[name for name, _ in fits], style="bold")
+    table.add_row("Exponent", *[f"n^{slope:.2f}" for _, slope in fits])
+
+    with Console() as console:
+        console.print(table)
+
+
+def parse_importtime(output: str) -> list[tuple[str, int, int, int]]:
+    imports: list[tuple[str, int, int, int]] = []
+    for line in output.split("\n"):
+        match line.removeprefix("import time:").split("|"):
+            case own, cumulative, name if own.strip().isdigit():
+                depth = (len(name) - len(name.lstrip()) - 1) // 2
+                imports.append((name.strip(), depth, int(own), int(cumulative)))
+
+    return imports
+
+
+@app.command("startup-time")
+def startup_time(
+    top: int = 15,
+    budget: float = typer.Option(None, help="Fail when importing aoc takes longer than this many milliseconds"),
+) -> None:
+    # Standard Library
+    import subprocess
+
+    # Third Party
+    from rich.console import Console
+    from rich.table import Table
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import aoc"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent,
+    )
+    imports = parse_importtime(result.stderr)
+    end = next(i for i, (name, depth, _, _) in enumerate(imports) if name == "aoc" and depth == 0)
+    start = max((i + 1 for i, (_, depth, _, _) in enumerate(imports[:end]) if depth == 0), default=0)
+    total = imports[end][3] / 1000
+
+    table = Table(title=f"AOC 2022 - Startup\n(import aoc: {total:.1f}ms)")
+    table.add_column("Module", justify="left", style="bold")
+    table.add_column("Self", justify="right")
+    table.add_column("Cumulative", justify="right")
+
+    direct = sorted((i for i in imports[start:end] if i[1] == 1), key=lambda i: i[3], reverse=True)
+    for name, _, own, cumulative in direct[:top]:
+        table.add_row(name, f"{own / 1000:.1f}ms", f"{cumulative / 1000:.1f}ms")
+
+    with Console() as console:
+        console.print(table)
+        if budget is not None and total > budget:
+            console.print(f"[bold red]Startup of {total:.1f}ms is over the {budget:.1f}ms budget[/bold red]")
+            raise typer.Exit(code=1)
+
+
+# -- Tests
+
+
+def test_timing_stats():
+    timing = Timing([0.1, 0.2, 0.3, 0.4, 1.0], 1)
+
+    assert timing.min == 0.1
+    assert timing.median == 0.3
+    assert round(timing.p95, 4) == 0.88
+    assert round(timing.stddev, 4) == 0.3536
+
+
+def test_timing_single_sample():
+    timing = Timing([0.5], 1)
+
+    assert timing.p95 == 0.5
+    assert timing.stddev == 0.0
+
+
+def test_history_round_trip(tmp_path):
+    # Standard Library
+    import platform
+
+    history = tmp_path / "history.jsonl"
+    save_history(history, {("day_01", 1): (Timing([0.4, 0.5], 1), Timing([0.1, 0.2, 0.3], 10))})
+
+    runs = load_history(history)
+    [records] = runs.values()
+
+    assert records[0]["day"] == "day_01"
+    assert records[0]["part"] == 1
+    assert records[0]["median"] == 0.2
+    assert records[0]["parse"] == 0.45
+    assert records[0]["python"] == platform.python_version()
+    assert records[0]["stream"] is False
+
+
+def test_pick_run():
+    runs = {
+        "2022-12-01": [{"commit": "aaaaaaa"}],
+        "2022-12-02": [{"commit": "bbbbbbb"}],
+        "2022-12-03": [{"commit": "aaaaaaa"}],
+    }
+
+    assert pick_run(runs, None) == "2022-12-03"
+    assert pick_run(runs, None, before="2022-12-03") == "2022-12-02"
+    assert pick_run(runs, "aaa", before="2022-12-03") == "2022-12-01"
+
+    runs["2022-12-04"] = [{"commit": "ccccccc", "stream": True}]
+    assert pick_run(runs, None, stream=True) == "2022-12-04"
+    assert pick_run(runs, None, stream=False) == "2022-12-03"
+
+
+def history_record(run: str, day: str, part: int, median: float, python: str = "3.11.0") -> dict[str, Any]:
+    return {"run": run, "commit": run, "python": python, "day": day, "part": part, "median": median}
+
+
+def compare_exit_code(tmp_path, records: list[dict[str, Any]]) -> int:
+    # Standard Library
+    import json
+
+    history = tmp_path / "history.jsonl"
+    history.write_text("".join(f"{json.dumps(record)}\n" for record in records))
+    try:
+        compare(baseline=None, candidate=None, threshold=0.05, history=history)
+    except typer.Exit as exit:
+        return exit.exit_code
+
+    return 0
+
+
+def test_compare(tmp_path):
+    baseline = [history_record("a", "day_01", 1, 1.0), history_record("a", "day_17", 2, 1.0)]
+
+    steady = [history_record("b", "day_01", 1, 1.01), history_record("b", "day_17", 2, 0.5)]
+    assert compare_exit_code(tmp_path, baseline + steady) == 0
+
+    slower = [history_record("b", "day_01", 1, 1.5), history_record("b", "day_17", 2, 1.0)]
+    assert compare_exit_code(tmp_path, baseline + slower) == 1
+
+    missing = [history_record("b", "day_01", 1, 1.0)]
+    assert compare_exit_code(tmp_path, baseline + missing) == 1
+
+    # a streamed run in between is neither the baseline nor compared against
+    streamed = [{**record, "run": "b", "commit": "b", "median": 3.0, "stream": True} for record in baseline]
+    later = [{**record, "run": "c", "commit": "c"} for record in steady]
+    assert compare_exit_code(tmp_path, baseline + streamed + later) == 0
+
+    other_python = [history_record("b", "day_01", 1, 5.0, "3.12.0"), history_record("b", "day_17", 2, 5.0, "3.12.0")]
+    assert compare_exit_code(tmp_path, baseline + other_python) == 1
+
+
+def test_frame_label():
+    assert frame_label("~", 0, "<built-in method builtins.max>") == "<built-in method builtins.max>"
+    assert frame_label("/src/day_17.py", 16, "__add__") == "__add__ (day_17.py:16)"
+
+
+def test_sampler():
+    def busy() -> None:
+        deadline = perf_counter_ns() + 50_000_000
+        while perf_counter_ns() < deadline:
+            pass
+
+    with Sampler(0.0001) as sampler:
+        busy()
+
+    assert sum(sampler.stacks.values()) > 0
+    [(stack, _)] = sampler.stacks.most_common(1)
+    assert stack[0].startswith("busy")
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512.0B"
+    assert format_bytes(1536) == "1.5KiB"
+    assert format_bytes(3 * 1024**3) == "3.0GiB"
+
+
+def test_parse_importtime():
+    output = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _json
+import time:       900 |       1020 |   json
+import time:       300 |       1320 | aoc"""
+
+    assert parse_importtime(output) == [("_json", 2, 120, 120), ("json", 1, 900, 1020), ("aoc", 0, 300, 1320)]
+
+
+def slow_unit(day: str, part: int) -> str:
+    if part == 2:
+        sleep(10)
+    if day == "broken":
+        raise ValueError("bad input")
+    return f"{day}-{part}"
+
+
+def test_run_units_inline():
+    results = run_units(slow_unit, [("fine", 1), ("broken", 1)])
+
+    assert results[("fine", 1)] == Outcome("OK", "fine-1")
+    assert results[("broken", 1)].status == "ERROR"
+    assert results[("broken", 1)].error == "ValueError: bad input"
+
+
+def test_run_units_supervised():
+    results = run_units(slow_unit, [("fine", 1), ("broken", 1), ("fine", 2)], jobs=2, timeout=1)
+
+    assert results[("fine", 1)] == Outcome("OK", "fine-1")
+    assert results[("broken", 1)].status == "ERROR"
+    assert results[("fine", 2)].status == "TIMEOUT"
+    assert str(results[("fine", 2)]) == "TIMEOUT"
+
+
+def test_answer_cache(tmp_path):
+    write_answer(tmp_path, "abc", Outcome("OK", 1234))
+    write_answer(tmp_path, "def", Outcome("ERROR", error="nope"))
+    write_answer(tmp_path, None, Outcome("OK", 1))
+
+    assert read_answer(tmp_path, "abc") == Outcome("OK", 1234)
+    assert read_answer(tmp_path, "def") is None
+    assert read_answer(tmp_path, None) is None
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_fit_complexity():
+    sizes = [100, 200, 400, 800, 1600]
+    assert fit_complexity(sizes, [3e-7 * n for n in sizes])[0] == "O(n)"
+    assert fit_complexity(sizes, [1e-9 * n**2 for n in sizes])[0] == "O(n²)"
+    assert fit_complexity(sizes, [2e-6 for _ in sizes])[0] == "O(1)"
+
+    _, slope = fit_complexity(sizes, [1e-9 * n**2 for n in sizes])
+    assert abs(slope - 2) < 1e-9
+
+
+def test_part_runner(tmp_path, monkeypatch):
+    fake_path = lambda day: str(tmp_path / f"{day}.txt")  # noqa: E731
+    monkeypatch.setattr("aoc.input_path", fake_path)
+    monkeypatch.setattr("utils.input_path", fake_path)
+    (tmp_path / "day_10.txt").write_text("noop\naddx 3\naddx -5\n" * 80)
+    load_day.cache_clear()
+    try:
+        assert streams("day_10", True) and not streams("day_10", False) and not streams("day_07", True)
+        assert run_day("day_10", 1, stream=True) == run_day("day_10", 1)
+    finally:
+        load_day.cache_clear()
+
+
+def generator_days() -> list[int]:
+    days = sorted(int(path.stem.removeprefix("day_")) for path in Path(__file__).parent.glob("day_*.py"))
+    return [day for day in days if hasattr(import_module(f"day_{day:02}"), "generate")]
+
+
+def pytest_generate_tests(metafunc):
+    # parametrized here rather than with a decorator so aoc doesn't import pytest
+    if "generator_day" in metafunc.fixturenames:
+        metafunc.parametrize("generator_day", generator_days())
+
+
+def test_generate_deterministic(generator_day):
+    _, make = load_generator(generator_day)
+    assert make(20, 1) == make(20, 1)
+    assert make(20, 1) != make(20, 2)
+
+
+def test_format_time():
+    assert format_time(1.5) == "1.500s"
+    assert format_time(0.0025) == "2.500ms"
+    assert format_time(0.0000025) == "2.500µs"
+    assert format_time(0.0000000025) == "2ns"
+
 
+# -- Main
 
 if __name__ == "__main__":
     app()
@@ -1,17 +1,71 @@
+# Standard Library
+import heapq
+from collections.abc import Iterator
+from random import Random
+from typing import Any
+
 # First Party
-from utils import no_input_skip, read_input
+from utils import Buffer, Input, ints_numpy, iter_int_groups, lines, no_input_skip, read_input, read_input_buffer
+
+
+def elf_totals(input: Input) -> Iterator[int]:
+    # an mmap streams through lines() so the file is never copied into memory
+    if isinstance(input, (str, bytes)):
+        yield from map(sum, iter_int_groups(input))
+        return
+
+    calories = 0
+    for line in lines(input):
+        if line:
+            calories += int(line)
+        else:
+            yield calories
+            calories = 0
+    yield calories
+
+
+def elf_totals_numpy(input: Buffer) -> Any:
+    # Third Party
+    import numpy
+
+    data = (input.encode() if isinstance(input, str) else bytes(input)).translate(None, b"\r").strip()
+    newlines = numpy.flatnonzero(numpy.frombuffer(data, dtype=numpy.uint8) == ord("\n"))
+    # a blank line is two newlines in a row, every line before it that isn't blank holds one int
+    blank = numpy.flatnonzero(numpy.diff(newlines) == 1) + 1
+    starts = numpy.unique(numpy.concatenate(([0], blank - numpy.arange(len(blank)))))
+    return numpy.add.reduceat(ints_numpy(data, signed=False), starts)
+
 
+def top_elves(input: Input, k: int) -> list[int]:
+    # nlargest keeps a heap of k, so the elves never have to be held or sorted all at once
+    return heapq.nlargest(k, elf_totals(input))
 
-def get_calorie_list(input: str) -> list[int]:
-    return sorted(map(lambda e: sum(map(int, e.split("\n"))), input.split("\n\n")), reverse=True)
 
+def top_elves_numpy(input: Buffer, k: int) -> list[int]:
+    totals = elf_totals_numpy(input)
+    if k < len(totals):
+        totals = totals[totals.argpartition(-k)[-k:]]
 
-def part_1(input: str) -> int:
-    return get_calorie_list(input)[0]
+    return sorted(totals.tolist(), reverse=True)
 
 
-def part_2(input: str) -> int:
-    return sum(get_calorie_list(input)[:3])
+def parse(input: Input) -> list[int]:
+    # the top three answer both parts, so one pass serves them both
+    return top_elves(input, 3)
+
+
+def part_1(top: list[int]) -> int:
+    return top[0]
+
+
+def part_2(top: list[int]) -> int:
+    return sum(top)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    elves = ("\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 10))) for _ in range(size))
+    return "\n\n".join(elves)
 
 
 # -- Tests
@@ -35,31 +89,75 @@ def get_example_input() -> str:
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 24000
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 45000
 
 
+def test_buffer():
+    test_input = parse(get_example_input().encode())
+    assert part_1(test_input) == 24000
+    assert part_2(test_input) == 45000
+
+
+def test_mmap(tmp_path):
+    # Standard Library
+    import mmap
+
+    path = tmp_path / "day_01.txt"
+    path.write_text(get_example_input() + "\n")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        assert parse(buffer) == [24000, 11000, 10000]
+
+
+def test_top_elves():
+    test_input = get_example_input()
+    assert top_elves(test_input, 3) == [24000, 11000, 10000]
+    assert top_elves(iter(test_input.split("\n")), 2) == [24000, 11000]
+    assert top_elves(test_input, 10) == [24000, 11000, 10000, 6000, 4000]
+
+
+def test_top_elves_numpy():
+    # Third Party
+    import pytest
+
+    pytest.importorskip("numpy")
+
+    test_input = get_example_input() + "\r\n\n"
+    assert top_elves_numpy(test_input, 3) == [24000, 11000, 10000]
+    assert top_elves_numpy(test_input.encode(), 10) == top_elves(test_input, 10)
+    generated = generate(200, seed=2)
+    assert top_elves_numpy(generated, 3) == top_elves(generated, 3)
+
+
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 70720
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 207148
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    totals = sorted((sum(map(int, elf.split("\n"))) for elf in generated.split("\n\n")), reverse=True)
+    assert len(totals) == 50
+    assert part_1(parse(generated)) == totals[0] == 390121
+    assert part_2(parse(generated)) == sum(totals[:3]) == 1022789
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input_buffer(__file__))
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
@@ -1,7 +1,12 @@
 # Standard Library
+from collections import Counter
+from mmap import mmap
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Input, lines, no_input_skip, read_input, read_input_buffer
+
+STREAMING = True
 
 ROCK = 1
 PAPAER = 2
@@ -34,15 +39,6 @@ scores: dict[tuple[int, int], int] = {
 }
 
 
-def part_1(input: str) -> int:
-    score = 0
-    for game in input.split("\n"):
-        them, you = game.split(" ")
-        score += scores[(moves[them], moves[you])] + moves[you]
-
-    return score
-
-
 def fix_game(them: int, you: int) -> int:
     losses = dict(zip([ROCK, PAPAER, SCISSORS], [SCISSORS, ROCK, PAPAER]))
 
@@ -55,13 +51,38 @@ def fix_game(them: int, you: int) -> int:
     return actions[you][them]
 
 
-def part_2(input: str) -> int:
-    score = 0
-    for game in input.split("\n"):
-        them, you = game.split(" ")
-        score += fix_game(moves[them], moves[you])
+# every game is one of nine lines, so score the lines once up front
+GAMES = [f"{them} {you}" for them in "ABC" for you in "XYZ"]
+PART_1 = {game: scores[(moves[game[0]], moves[game[2]])] + moves[game[2]] for game in GAMES}
+PART_2 = {game: fix_game(moves[game[0]], moves[game[2]]) for game in GAMES}
+
+
+def count_games(input: Input) -> Counter[str]:
+    if isinstance(input, str):
+        return Counter({game: input.count(game) for game in GAMES})
+
+    if isinstance(input, (bytes, mmap)):
+        data = bytes(input)
+        return Counter({game: data.count(game.encode()) for game in GAMES})
+
+    return Counter(lines(input))
+
+
+def score(games: Counter[str], table: dict[str, int]) -> int:
+    return sum(table[game] * count for game, count in games.items() if count)
+
+
+def part_1(input: Input) -> int:
+    return score(count_games(input), PART_1)
 
-    return score
+
+def part_2(input: Input) -> int:
+    return score(count_games(input), PART_2)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size))
 
 
 # -- Tests
@@ -83,6 +104,20 @@ def test_part_2():
     assert part_2(test_input) == 12
 
 
+def test_buffer():
+    test_input = get_example_input().encode()
+    assert part_1(test_input) == 15
+    assert part_2(test_input) == 12
+
+
+def test_count_games():
+    games = count_games(get_example_input())
+    assert games == count_games(iter(get_example_input().split("\n")))
+    assert sum(games.values()) == 3 and games["A Y"] == 1
+    assert (score(games, PART_1), score(games, PART_2)) == (15, 12)
+    assert PART_1["A Y"] == 8 and PART_2["C Z"] == 7
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -95,10 +130,18 @@ def test_part_2_real():
     assert part_2(real_input) == 14204
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    rounds = [("ABC".index(line[0]), "XYZ".index(line[2])) for line in generated.split("\n")]
+    # rock paper scissors as arithmetic mod 3, independent of the lookup tables
+    assert part_1(generated) == sum(me + 1 + 3 * ((me - them + 1) % 3) for them, me in rounds) == 276
+    assert part_2(generated) == sum((them + outcome - 1) % 3 + 1 + 3 * outcome for them, outcome in rounds) == 255
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = read_input_buffer(__file__)
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
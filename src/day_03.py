@@ -1,15 +1,20 @@
+# Standard Library
+from random import Random
+
 # First Party
-from utils import no_input_skip, read_input
+from utils import Buffer, Input, lines, no_input_skip, read_input, read_input_buffer
+
+STREAMING = True
 
 priorities = {
     **{chr(i + 96): i for i in range(1, 27)},
-    **{chr(i + 38): i for i in range(26, 53)},
+    **{chr(i + 38): i for i in range(27, 53)},
 }
 
 
-def part_1(input: str) -> int:
+def part_1(input: Input) -> int:
     priority = 0
-    for line in input.split("\n"):
+    for line in lines(input):
         in_both = set(line[: len(line) // 2]).intersection(line[len(line) // 2 :])
         for item in in_both:
             priority += priorities[item]
@@ -17,17 +22,62 @@ def part_1(input: str) -> int:
     return priority
 
 
-def part_2(input: str) -> int:
+def part_2(input: Input) -> int:
     priority = 0
-    lines = input.split("\n")
-    for i in range(0, len(lines), 3):
-        in_group = set(lines[i]).intersection(lines[i + 1]).intersection(lines[i + 2])
+    rucksacks = lines(input)
+    for first, second, third in zip(rucksacks, rucksacks, rucksacks):
+        in_group = set(first).intersection(second).intersection(third)
         for c in in_group:
             priority += priorities[c]
 
     return priority
 
 
+def priorities_numpy(input: Buffer) -> tuple[int, int]:
+    # Third Party
+    import numpy
+
+    table = numpy.zeros(256, dtype=numpy.intp)
+    table[list(map(ord, priorities))] = list(priorities.values())
+
+    data = (input.encode() if isinstance(input, str) else bytes(input)).translate(None, b"\r").strip() + b"\n"
+    chars = numpy.frombuffer(data, dtype=numpy.uint8)
+    newline = chars == ord("\n")
+    ends = numpy.flatnonzero(newline)
+    starts = numpy.concatenate(([0], ends[:-1] + 1))
+
+    items = numpy.flatnonzero(~newline)
+    rows = numpy.repeat(numpy.arange(len(ends)), ends - starts)
+    second = 2 * (items - starts[rows]) >= (ends - starts)[rows]
+
+    # each rucksack half is a 53 bit mask, one bool per priority
+    seen = numpy.zeros((len(ends), 2, 53), dtype=bool)
+    seen.reshape(-1)[(rows * 2 + second) * 53 + table[chars[items]]] = True
+
+    weights = numpy.arange(53)
+    groups = seen.any(axis=1)[: len(ends) - len(ends) % 3].reshape(-1, 3, 53).all(axis=1)
+    return int(((seen[:, 0] & seen[:, 1]) @ weights).sum()), int((groups @ weights).sum())
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    items = list(priorities)
+    rucksacks = []
+    for _ in range(-(-size // 3)):
+        rng.shuffle(items)
+        badge = items[0]
+        for elf in range(3):
+            shared, *pool = items[1 + elf * 17 : 18 + elf * 17]
+            length = rng.randint(4, 24)
+            first = [shared, badge, *rng.choices(pool[:8], k=length - 2)]
+            second = [shared, *rng.choices(pool[8:], k=length - 1)]
+            rng.shuffle(first)
+            rng.shuffle(second)
+            rucksacks.append("".join(first + second))
+
+    return "\n".join(rucksacks)
+
+
 # -- Tests
 
 
@@ -50,6 +100,28 @@ def test_part_2():
     assert part_2(test_input) == 70
 
 
+def test_buffer():
+    test_input = get_example_input().encode()
+    assert part_1(test_input) == 157
+    assert part_2(test_input) == 70
+
+
+def test_priorities():
+    assert len(priorities) == 52
+    assert (priorities["a"], priorities["z"], priorities["A"], priorities["Z"]) == (1, 26, 27, 52)
+
+
+def test_priorities_numpy():
+    # Third Party
+    import pytest
+
+    pytest.importorskip("numpy")
+
+    assert priorities_numpy(get_example_input() + "\r\n") == (157, 70)
+    generated = generate(300, seed=3)
+    assert priorities_numpy(generated.encode()) == (part_1(generated), part_2(generated))
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -62,10 +134,23 @@ def test_part_2_real():
     assert part_2(real_input) == 2607
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    rucksacks = generated.split("\n")
+    assert len(rucksacks) == 51
+
+    def shared(*groups: str) -> int:
+        (item,) = set.intersection(*map(set, groups))
+        return priorities[item]
+
+    assert part_1(generated) == sum(shared(r[: len(r) // 2], r[len(r) // 2 :]) for r in rucksacks) == 1355
+    assert part_2(generated) == sum(shared(*rucksacks[i : i + 3]) for i in range(0, 51, 3)) == 432
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = read_input_buffer(__file__)
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
@@ -1,26 +1,51 @@
+# Standard Library
+from random import Random
+
 # First Party
-from utils import no_input_skip, read_input
+from utils import Buffer, Input, ints_numpy, lines, no_input_skip, read_input, read_input_buffer
+
+STREAMING = True
+
 
+Interval = tuple[int, int]
 
-def expand(group: str) -> list[int]:
+
+def expand(group: str) -> Interval:
     start, end = map(int, group.split("-"))
-    return list(range(start, end + 1))
+    return start, end
+
+
+def contains(one: Interval, two: Interval) -> int:
+    return int(one[0] <= two[0] and two[1] <= one[1] or two[0] <= one[0] and one[1] <= two[1])
 
 
-def contains(one: list[int], two: list[int]) -> int:
-    return int(all(i in two for i in one) or all(i in one for i in two))
+def overlaps(one: Interval, two: Interval) -> int:
+    return int(one[0] <= two[1] and two[0] <= one[1])
 
 
-def overlaps(one: list[int], two: list[int]) -> int:
-    return int(any(i in two for i in one))
+def counts_numpy(input: Buffer) -> tuple[int, int]:
+    one_start, one_end, two_start, two_end = ints_numpy(input, signed=False).reshape(-1, 4).T
+    contained = (one_start <= two_start) & (two_end <= one_end) | (two_start <= one_start) & (one_end <= two_end)
+    overlapping = (one_start <= two_end) & (two_start <= one_end)
+    return int(contained.sum()), int(overlapping.sum())
 
 
-def part_1(input: str) -> int:
-    return sum(map(lambda line: contains(*map(expand, line.split(","))), input.split("\n")))
+def part_1(input: Input) -> int:
+    return sum(map(lambda line: contains(*map(expand, line.split(","))), lines(input)))
 
 
-def part_2(input: str) -> int:
-    return sum(map(lambda line: overlaps(*map(expand, line.split(","))), input.split("\n")))
+def part_2(input: Input) -> int:
+    return sum(map(lambda line: overlaps(*map(expand, line.split(","))), lines(input)))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+
+    def assignment() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return "\n".join(f"{assignment()},{assignment()}" for _ in range(size))
 
 
 # -- Tests
@@ -45,6 +70,32 @@ def test_part_2():
     assert part_2(test_input) == 4
 
 
+def test_buffer():
+    test_input = get_example_input().encode()
+    assert part_1(test_input) == 2
+    assert part_2(test_input) == 4
+
+
+def test_intervals():
+    assert expand("2-8") == (2, 8)
+    assert contains((2, 8), (3, 7)) == contains((3, 7), (2, 8)) == 1
+    assert contains((2, 3), (3, 4)) == 0
+    assert overlaps((5, 7), (7, 9)) == overlaps((7, 9), (5, 7)) == 1
+    assert overlaps((2, 3), (4, 5)) == 0
+    assert contains((1, 5_000_000), (2, 4_000_000)) == 1
+
+
+def test_counts_numpy():
+    # Third Party
+    import pytest
+
+    pytest.importorskip("numpy")
+
+    assert counts_numpy(get_example_input()) == (2, 4)
+    generated = generate(500, seed=2)
+    assert counts_numpy(generated.encode()) == (part_1(generated), part_2(generated))
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -57,10 +108,20 @@ def test_part_2_real():
     assert part_2(real_input) == 770
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    ranges = [[map(int, elf.split("-")) for elf in line.split(",")] for line in generated.split("\n")]
+    pairs = [[range(a, b + 1) for a, b in line] for line in ranges]
+    contained = sum(set(a) <= set(b) or set(b) <= set(a) for a, b in pairs)
+    overlapping = sum(bool(set(a) & set(b)) for a, b in pairs)
+    assert part_1(generated) == contained == 12
+    assert part_2(generated) == overlapping == 23
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = read_input_buffer(__file__)
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
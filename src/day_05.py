@@ -1,45 +1,71 @@
 # Standard Library
-import re
+from array import array
 from collections import defaultdict
+from random import Random
+from string import ascii_uppercase
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import ints, no_input_skip, read_input
 
 
-def parse_input(input: str) -> tuple[dict[int, list[str]], list[dict[str, int]]]:
-    inital, raw_moves = map(lambda i: i.split("\n"), input.split("\n\n"))
+def parse_input(input: str) -> tuple[dict[int, list[str]], array]:
+    inital, raw_moves = input.split("\n\n")
 
     stacks = defaultdict(lambda: [])
-    for row in reversed(inital[:-1]):
+    for row in reversed(inital.split("\n")[:-1]):
         for i in range(1, len(row), 4):
             if row[i] != " ":
                 stacks[(i // 4) + 1].append(row[i])
 
-    moves = []
-    for move in raw_moves:
-        parsed = re.search(r"^move\s(?P<count>\d+)\sfrom\s(?P<from>\d+)\sto\s(?P<to>\d+)$", move, re.MULTILINE)
-        if parsed is not None:
-            moves.append({k: int(v) for k, v in parsed.groupdict().items()})
+    # flat count, from, to triples
+    moves = ints(raw_moves, signed=False)
+    if len(moves) % 3:
+        raise ValueError(f"{len(moves)} numbers don't make whole moves")
 
     return dict(stacks), moves
 
 
-def part_1(input: str) -> str:
+def move_crates(input: str, in_order: bool) -> str:
     stacks, moves = parse_input(input)
 
-    for move in moves:
-        stacks[move["to"]].extend([stacks[move["from"]].pop() for _ in range(move["count"])])
+    for count, source, target in zip(*[iter(moves)] * 3):
+        # slice from the front, -0 would take the whole stack
+        crates = stacks[source]
+        split = len(crates) - count
+        stacks[target].extend(crates[split:] if in_order else reversed(crates[split:]))
+        del crates[split:]
 
     return "".join(f"{stack[-1]}" for stack in stacks.values())
 
 
+def part_1(input: str) -> str:
+    return move_crates(input, in_order=False)
+
+
 def part_2(input: str) -> str:
-    stacks, moves = parse_input(input)
+    return move_crates(input, in_order=True)
 
-    for move in moves:
-        stacks[move["to"]].extend(reversed([stacks[move["from"]].pop() for _ in range(move["count"])]))
 
-    return "".join(f"{stack[-1]}" for stack in stacks.values())
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    stacks = [rng.choices(ascii_uppercase, k=rng.randint(2, 10)) for _ in range(9)]
+    heights = [len(stack) for stack in stacks]
+
+    moves = []
+    for _ in range(size):
+        source = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        target = rng.choice([i for i in range(9) if i != source])
+        count = rng.randint(1, heights[source] - 1)
+        heights[source] -= count
+        heights[target] += count
+        moves.append(f"move {count} from {source + 1} to {target + 1}")
+
+    rows = []
+    for level in reversed(range(max(map(len, stacks)))):
+        rows.append(" ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks).rstrip())
+    rows.append(" ".join(f" {i + 1} " for i in range(9)))
+
+    return "\n".join(rows) + "\n\n" + "\n".join(moves)
 
 
 # -- Tests
@@ -67,6 +93,25 @@ def test_part_2():
     assert part_2(test_input) == "MCD"
 
 
+def test_parse_input():
+    stacks, moves = parse_input(get_example_input())
+    assert stacks == {1: ["Z", "N"], 2: ["M", "C", "D"], 3: ["P"]}
+    assert list(moves) == [1, 2, 1, 3, 1, 3, 2, 2, 1, 1, 1, 2]
+
+
+def test_move_everything():
+    test_input = "[A]\n[B] [C]\n 1   2\n\nmove 2 from 1 to 2\nmove 1 from 2 to 1"
+    assert part_1(test_input) == "BA"
+    assert part_2(test_input) == "AB"
+
+
+def test_move_nothing():
+    stacks, _ = get_example_input().split("\n\n")
+    test_input = stacks + "\n\nmove 0 from 1 to 2\nmove 1 from 2 to 1"
+    assert part_1(test_input) == "DCP"
+    assert part_2(test_input) == "DCP"
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -79,6 +124,17 @@ def test_part_2_real():
     assert part_2(real_input) == "PGSQBFLDP"
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    drawing = generated.split("\n\n")[0]
+    # moving crates around never changes which letters are in play
+    crates = set(drawing) & set(ascii_uppercase)
+    assert set(part_1(generated)) <= crates
+    assert set(part_2(generated)) <= crates
+    assert part_1(generated) == "FMWAZSYKM"
+    assert part_2(generated) == "DMWASSYYM"
+
+
 # -- Main
 
 if __name__ == "__main__":
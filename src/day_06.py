@@ -1,11 +1,38 @@
+# Standard Library
+from collections.abc import Iterator, Sequence
+from random import Random
+
 # First Party
-from utils import no_input_skip, read_input
+from utils import Buffer, no_input_skip, read_input
+
+
+def iter_markers(input: Buffer, lengths: Sequence[int]) -> Iterator[tuple[int, int]]:
+    # start is where the longest run of distinct chars ending at i begins, a window of
+    # any length fits in that run so one pass serves every length
+    data = input.encode() if isinstance(input, str) else memoryview(input)
+    last_seen = [-1] * 256
+    start = 0
+    for i, char in enumerate(data):
+        if last_seen[char] >= start:
+            start = last_seen[char] + 1
+        last_seen[char] = i
+
+        for length in lengths:
+            if i - start >= length - 1:
+                yield length, i + 1
+
 
+def find_markers(input: Buffer, lengths: Sequence[int]) -> dict[int, list[int]]:
+    markers: dict[int, list[int]] = {length: [] for length in lengths}
+    for length, position in iter_markers(input, lengths):
+        markers[length].append(position)
 
-def find_uniq_position(input: str, length: int) -> int:
-    for i in range(len(input) - length):
-        if len(set(input[i : i + length])) == length:
-            return i + length
+    return markers
+
+
+def find_uniq_position(input: Buffer, length: int) -> int:
+    for _, position in iter_markers(input, [length]):
+        return position
 
     raise Exception("No solution found")
 
@@ -18,6 +45,11 @@ def part_2(input: str) -> int:
     return find_uniq_position(input, 14)
 
 
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    return "".join(rng.choices("abc", k=size)) + "defghijklmnopq"
+
+
 # -- Tests
 
 
@@ -35,6 +67,24 @@ def test_part_2():
     assert part_2(test_input) == 19
 
 
+def test_last_window():
+    assert find_uniq_position("aabcd", 4) == 5
+    assert find_uniq_position(b"abcd", 4) == 4
+
+
+def test_no_marker():
+    # Third Party
+    import pytest
+
+    with pytest.raises(Exception, match="No solution found"):
+        find_uniq_position("abcabc", 4)
+
+
+def test_find_markers():
+    assert find_markers("abcabdd", [3, 4]) == {3: [3, 4, 5, 6], 4: [6]}
+    assert find_markers(get_example_input().encode(), [4, 14])[14][0] == 19
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -47,6 +97,15 @@ def test_part_2_real():
     assert part_2(real_input) == 2301
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    # the random part only uses abc, so the markers land in the distinct tail
+    assert 50 < part_1(generated) <= 54
+    assert 60 < part_2(generated) <= 64
+    assert part_1(generated) == 53
+    assert part_2(generated) == 63
+
+
 # -- Main
 
 if __name__ == "__main__":
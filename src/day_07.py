@@ -1,79 +1,84 @@
 # Standard Library
-from collections import defaultdict
-from functools import lru_cache
-from os import path
+from array import array
+from random import Random
 
 # First Party
 from utils import no_input_skip, read_input
 
 
-class dir:
-    def __init__(self, tree: dict[str, "dir"]) -> None:
-        self.files: list[int] = []
-        self.children: list[str] = []
-        self.dir_tree: dict[str, "dir"] = tree
-
-    @lru_cache
-    def __int__(self) -> int:
-        total = sum(list(self.files))
-
-        for c in self.children:
-            total += int(self.dir_tree[c])
-
-        return total
-
-    @staticmethod
-    def parse(input: str) -> dict[str, "dir"]:
-        dir_tree: dict[str, dir] = defaultdict(lambda: dir(dir_tree))
-        cwd = ""
-
-        @lru_cache
-        def abspath(*args):
-            return path.abspath(path.join(*args))
-
-        for line in input.split("\n"):
-            match line.split(" "):
-                case ("$", *args):
-                    match args:
-                        case ("cd", d):
-                            cwd = abspath(cwd, d)
-                case ("dir", d):
-                    dir_tree[cwd].children.append(abspath(cwd, d))
-                case (size, _):
-                    dir_tree[cwd].files.append(int(size))
-                case _:
-                    raise Exception(f"Unknow line: {line}")
-
-        return dir_tree
-
-
-def part_1(input: str) -> int:
+def parse(input: str) -> array:
+    # directories are numbered as they're found, so a child always comes after its parent
+    parents = array("l", [0])
+    sizes = array("q", [0])
+    paths: dict[tuple[int, str], int] = {}
+    cwd = 0
+
+    def intern(name: str) -> int:
+        if (index := paths.get((cwd, name))) is None:
+            index = paths[(cwd, name)] = len(sizes)
+            parents.append(cwd)
+            sizes.append(0)
+
+        return index
+
+    for line in input.split("\n"):
+        match line.split(" "):
+            case ("$", "cd", "/"):
+                cwd = 0
+            case ("$", "cd", ".."):
+                cwd = parents[cwd]
+            case ("$", "cd", d):
+                cwd = intern(d)
+            case ("$", *_):
+                pass
+            case ("dir", d):
+                intern(d)
+            case (size, _):
+                sizes[cwd] += int(size)
+            case _:
+                raise Exception(f"Unknow line: {line}")
+
+    # walking back down the numbering adds every directory into its parent after all of its children
+    for index in range(len(sizes) - 1, 0, -1):
+        sizes[parents[index]] += sizes[index]
+
+    return sizes
+
+
+def part_1(sizes: array) -> int:
     MAX_SIZE = 100000
 
-    dir_tree = dir.parse(input)
-
-    totals = 0
-    for folder in dir_tree.values():
-        if (total := int(folder)) <= MAX_SIZE:
-            totals += total
+    return sum(size for size in sizes if size <= MAX_SIZE)
 
-    return totals
 
-
-def part_2(input: str) -> int:
+def part_2(sizes: array) -> int:
     MAX_SIZE = 70000000
     MIN_FREE = 30000000
 
-    dir_tree = dir.parse(input)
+    needed_space = MIN_FREE - (MAX_SIZE - sizes[0])
+
+    return min(size for size in sizes if size >= needed_space)
+
 
-    needed_space = MIN_FREE - (MAX_SIZE - int(dir_tree["/"]))
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    children: list[list[int]] = [[] for _ in range(size)]
+    for node in range(1, size):
+        children[rng.randrange(node)].append(node)
 
-    totals = []
-    for folder in dir_tree.values():
-        if (total := int(folder)) >= needed_space:
-            totals.append(total)
+    lines = ["$ cd /"]
 
-    return min(totals)
+    def listing(node: int) -> None:
+        lines.append("$ ls")
+        lines.extend(f"dir d{child}" for child in children[node])
+        lines.extend(f"{rng.randint(1, 300000)} f{i}.txt" for i in range(rng.randint(1, 5)))
+        for child in children[node]:
+            lines.append(f"$ cd d{child}")
+            listing(child)
+            lines.append("$ cd ..")
+
+    listing(0)
+    return "\n".join(lines)
 
 
 # -- Tests
@@ -106,31 +111,48 @@ $ ls
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 95437
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 24933642
 
 
+def test_parse():
+    assert list(parse(get_example_input())) == [48381165, 94853, 24933642, 584]
+    assert list(parse("$ cd /\n$ cd a\n$ ls\n5 x\n$ cd /\n$ cd a\n$ ls\ndir b")) == [5, 5, 0]
+
+
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 1334506
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 7421137
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    assert generated.count("$ ls") == 50
+
+    sizes = parse(generated)
+    assert len(sizes) == 50
+    assert sizes[0] == sum(int(line.split(" ")[0]) for line in generated.split("\n") if line[0].isdigit())
+    assert part_1(sizes) == 43639
+    # the whole tree is well under the space needed, so any directory frees enough
+    assert part_2(sizes) == min(sizes)
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
@@ -1,68 +1,121 @@
 # Standard Library
-from collections.abc import Callable, Iterable
-from math import prod
+from collections.abc import Iterator
+from random import Random
+from string import digits
 
 # First Party
 from utils import no_input_skip, read_input
+from utils.grid import HAS_NUMPY, Grid
 
 
-def map_trees(input: str) -> tuple[dict[tuple[int, int], int], int, int]:
-    tree_map = {}
+def map_trees(input: str) -> Grid:
+    return Grid.parse(input, int)
 
-    for y, line in enumerate(input.split("\n")):
-        for x, tree in enumerate(line):
-            tree_map[(x, y)] = int(tree)
 
-    max_x = max(map(lambda p: p[0], tree_map)) + 1
-    max_y = max(map(lambda p: p[1], tree_map)) + 1
+def visible_numpy(grid: Grid) -> int:
+    # Third Party
+    import numpy
 
-    return tree_map, max_x, max_y
+    trees = grid.view()
+    visible = numpy.zeros(trees.shape, dtype=bool)
+    for turn in range(4):
+        rotated = numpy.rot90(trees, turn)
+        tallest = numpy.maximum.accumulate(rotated, axis=1)
+        seen = numpy.rot90(visible, turn)
+        seen[:, 0] = True
+        seen[:, 1:] |= rotated[:, 1:] > tallest[:, :-1]
+
+    return int(visible.sum())
+
+
+def lines_of_sight(grid: Grid) -> Iterator[range]:
+    # every row and column as flat indexes, looking in from both ends
+    for y in range(grid.height):
+        row = range(grid.index(0, y), grid.index(0, y) + grid.width)
+        yield row
+        yield row[::-1]
+
+    for x in range(grid.width):
+        column = range(x, len(grid.cells), grid.width)
+        yield column
+        yield column[::-1]
+
+
+def visible_sweeps(grid: Grid) -> int:
+    cells = grid.cells
+    visible = bytearray(len(cells))
+    for line in lines_of_sight(grid):
+        tallest = -1
+        for i in line:
+            if cells[i] > tallest:
+                visible[i] = 1
+                tallest = cells[i]
+
+    return sum(visible)
 
 
 def part_1(input: str) -> int:
-    tree_map, max_x, max_y = map_trees(input)
+    grid = map_trees(input)
+    return visible_numpy(grid) if HAS_NUMPY else visible_sweeps(grid)
+
+
+def scenic_stacks(grid: Grid) -> int:
+    cells = grid.cells
+    scores = [1] * len(cells)
+    for line in lines_of_sight(grid):
+        # trees behind us that nothing since has been as tall as, shortest on top
+        stack: list[tuple[int, int]] = []
+        for distance, i in enumerate(line):
+            tree = cells[i]
+            while stack and stack[-1][1] < tree:
+                stack.pop()
+            scores[i] *= distance - stack[-1][0] if stack else distance
+            stack.append((distance, tree))
+
+    return max(scores)
 
-    visible = max_x + max_y - 1
-    for x, y in tree_map:
-        if x in [0, max_x] or y in [0, max_y]:
-            continue
 
-        visible += int(
-            any(
-                [
-                    all(tree_map[(x, y)] > tree_map[(tx, y)] for tx in range(x)),
-                    all(tree_map[(x, y)] > tree_map[(tx, y)] for tx in range(x + 1, max_x)),
-                    all(tree_map[(x, y)] > tree_map[(x, ty)] for ty in range(y)),
-                    all(tree_map[(x, y)] > tree_map[(x, ty)] for ty in range(y + 1, max_y)),
-                ]
-            )
-        )
+def scenic_numpy(grid: Grid) -> int:
+    # Third Party
+    import numpy
 
-    return visible
+    trees = grid.view()
+    scores = numpy.ones(trees.shape, dtype=numpy.int64)
+    heights = numpy.arange(10, dtype=numpy.int8)[:, None]
+    for turn in range(4):
+        # a row per step into the forest, every lane across the forest moves forward together
+        steps = numpy.ascontiguousarray(numpy.rot90(trees, turn).T)
+        lanes = steps.shape[1]
+        distances = numpy.empty(steps.shape, dtype=numpy.int32)
 
+        # where the last tree at least as tall as each height stands in each lane, 0 being the edge
+        blockers = numpy.zeros((10, lanes), dtype=numpy.int32)
+        taller = numpy.empty(blockers.shape, dtype=bool)
+        moved = numpy.empty(blockers.shape, dtype=numpy.int32)
+        offsets = numpy.arange(lanes, dtype=numpy.intp)
+        index = numpy.empty(lanes, dtype=numpy.intp)
+        for x, step in enumerate(steps):
+            numpy.multiply(step, numpy.intp(lanes), out=index)
+            index += offsets
+            numpy.subtract(x, blockers.take(index), out=distances[x])
 
-def one_until(predicate: Callable, iterable: Iterable):
-    for x in iterable:
-        yield 1
-        if predicate(x):
-            break
+            numpy.less_equal(heights, step, out=taller)
+            numpy.multiply(taller, numpy.int32(x), out=moved)
+            numpy.maximum(blockers, moved, out=blockers)
+
+        numpy.rot90(scores, turn)[...] *= distances.T
+
+    return int(scores.max())
 
 
 def part_2(input: str) -> int:
-    tree_map, max_x, max_y = map_trees(input)
-
-    scores = [
-        prod(
-            [
-                sum(one_until(lambda tx: tree_map[(x, y)] <= tree_map[(tx, y)], reversed(range(x)))),
-                sum(one_until(lambda tx: tree_map[(x, y)] <= tree_map[(tx, y)], range(x + 1, max_x))),
-                sum(one_until(lambda ty: tree_map[(x, y)] <= tree_map[(x, ty)], reversed(range(y)))),
-                sum(one_until(lambda ty: tree_map[(x, y)] <= tree_map[(x, ty)], range(y + 1, max_y))),
-            ],
-        )
-        for x, y in tree_map
-    ]
-    return max(scores)
+    grid = map_trees(input)
+    return scenic_numpy(grid) if HAS_NUMPY else scenic_stacks(grid)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    return "\n".join("".join(rng.choices(digits, k=size)) for _ in range(size))
 
 
 # -- Tests
@@ -86,6 +139,25 @@ def test_part_2():
     assert part_2(test_input) == 8
 
 
+def test_visible_sweeps():
+    assert visible_sweeps(map_trees(get_example_input())) == 21
+
+
+def test_scenic_stacks():
+    assert scenic_stacks(map_trees(get_example_input())) == 8
+
+
+def test_numpy_matches_sweeps():
+    # Third Party
+    import pytest
+
+    pytest.importorskip("numpy")
+
+    grid = map_trees(generate(40, seed=3))
+    assert visible_numpy(grid) == visible_sweeps(grid)
+    assert scenic_numpy(grid) == scenic_stacks(grid)
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -98,6 +170,14 @@ def test_part_2_real():
     assert part_2(real_input) == 172224
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    # the edge is always visible, at most every tree is
+    assert 4 * 49 <= part_1(generated) <= 50 * 50
+    assert part_1(generated) == 520
+    assert part_2(generated) == 33696
+
+
 # -- Main
 
 if __name__ == "__main__":
@@ -1,56 +1,74 @@
 # Standard Library
-from collections import defaultdict
-from itertools import repeat
-from typing import cast
+import io
+from array import array
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Input, lines, no_input_skip, read_input
+from utils.geometry import Packing
 
 MOVES = {"U": (0, 1), "D": (0, -1), "R": (1, 0), "L": (-1, 0)}
 
-Point = tuple[int, int]
+# visited cells are packed as x + y * 2**32, so a straight run is a range of packed ints
+PACKING = Packing(1 << 32)
 
+STREAMING = True
 
-def move(x: int) -> int:
-    return (x > 0) - (x < 0)
 
+def stretched(xs: array, ys: array, dx: int, dy: int) -> bool:
+    return all(xs[i - 1] - xs[i] == dx and ys[i - 1] - ys[i] == dy for i in range(1, len(xs)))
 
-def add(a: Point, b: Point) -> Point:
-    return cast(Point, tuple(x + y for x, y in list(zip(a, b))))
 
+def simulate(input: Input, length: int) -> int:
+    xs = array("q", [0]) * length
+    ys = array("q", [0]) * length
+    tail = length - 1
+    visited = {PACKING.pack(0, 0)}
 
-def follow(leader: Point, follower: Point) -> Point:
-    diff_x, diff_y = (x - y for x, y in zip(leader, follower))
-    if abs(diff_x) > 1 or abs(diff_y) > 1:
-        return add(follower, (move(diff_x), move(diff_y)))
-
-    return follower
-
-
-def simulate(input: str, length: int) -> int:
-    rope: list[Point] = list(repeat((0, 0), length))
-    visited = defaultdict(lambda: 0)
-
-    for line in input.split("\n"):
+    for line in lines(input):
         direction, amount = line.split(" ")
-        for _ in range(int(amount)):
-            rope[0] = add(rope[0], MOVES[direction])
-            for i in range(1, len(rope)):
-                rope[i] = follow(rope[i - 1], rope[i])
-
-            visited[rope[-1]] = 1
-
-    return sum(visited.values())
-
-
-def part_1(input: str) -> int:
+        dx, dy = MOVES[direction]
+        remaining = int(amount)
+        while remaining:
+            remaining -= 1
+            xs[0] += dx
+            ys[0] += dy
+            for i in range(1, length):
+                diff_x = xs[i - 1] - xs[i]
+                diff_y = ys[i - 1] - ys[i]
+                if -1 <= diff_x <= 1 and -1 <= diff_y <= 1:
+                    # nothing further back can move if this knot didn't
+                    break
+                xs[i] += (diff_x > 0) - (diff_x < 0)
+                ys[i] += (diff_y > 0) - (diff_y < 0)
+            else:
+                packed = PACKING.pack(xs[tail], ys[tail])
+                visited.add(packed)
+                if remaining and stretched(xs, ys, dx, dy):
+                    # a straight rope just slides along, so the tail covers the rest of the run in one go
+                    step = PACKING.pack(dx, dy)
+                    visited.update(range(packed + step, packed + step * (remaining + 1), step))
+                    for i in range(length):
+                        xs[i] += dx * remaining
+                        ys[i] += dy * remaining
+                    remaining = 0
+
+    return len(visited)
+
+
+def part_1(input: Input) -> int:
     return simulate(input, 2)
 
 
-def part_2(input: str) -> int:
+def part_2(input: Input) -> int:
     return simulate(input, 10)
 
 
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    return "\n".join(f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(size))
+
+
 # -- Tests
 
 
@@ -86,6 +104,23 @@ def test_part_2():
     assert part_2(test_input) == 36
 
 
+def test_stream():
+    assert part_1(io.StringIO(get_example_input_1() + "\n")) == 13
+    assert part_2(iter(get_example_input_2().split("\n"))) == 36
+
+
+def test_fast_forward():
+    assert simulate("R 100000", 10) == 100000 - 8
+    assert simulate("L 5\nU 100000", 2) == 4 + 100000
+    assert simulate("D 3\nR 3", 10) == 1
+
+
+def test_long_rope():
+    assert simulate("R 100\nU 100", 1000) == 1
+    assert simulate("R 1500\nD 5", 1000) == 504
+    assert simulate(get_example_input_2(), 10) == 36
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -98,6 +133,14 @@ def test_part_2_real():
     assert part_2(real_input) == 2493
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    # a longer rope can only cut corners, so the tail visits fewer places
+    assert part_1(generated) >= part_2(generated)
+    assert part_1(generated) == 440
+    assert part_2(generated) == 289
+
+
 # -- Main
 
 if __name__ == "__main__":
@@ -1,17 +1,21 @@
 # Standard Library
+import io
 from collections import defaultdict
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Input, lines, no_input_skip, read_input
 
 SCREEN_WIDTH = 40
 
+STREAMING = True
 
-def processor(input: str):
+
+def processor(input: Input):
     register = 1
     cycle = 0
 
-    for line in input.split("\n"):
+    for line in lines(input):
         cycle += 1
         yield cycle, register
         match line.split(" "):
@@ -25,7 +29,7 @@ def processor(input: str):
                 raise Exception(f"Invalid command: {line}")
 
 
-def part_1(input: str) -> int:
+def part_1(input: Input) -> int:
     strength = 0
     check_cycle = 20
     for i, signal_strength in processor(input):
@@ -39,7 +43,7 @@ def part_1(input: str) -> int:
     raise Exception("Not enough input")
 
 
-def part_2(input: str, lit: str = "#", unlit: str = " ") -> str:
+def part_2(input: Input, lit: str = "#", unlit: str = " ") -> str:
     display: dict[int, str] = defaultdict(lambda: "")
 
     for cycle, signal in processor(input):
@@ -50,6 +54,21 @@ def part_2(input: str, lit: str = "#", unlit: str = " ") -> str:
     return "\n" + "\n".join(display.values())
 
 
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    register = 1
+    lines = []
+    for _ in range(max(size, 220)):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            value = rng.randint(max(-5, -register), min(5, SCREEN_WIDTH - 1 - register))
+            register += value
+            lines.append(f"addx {value}")
+
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -222,6 +241,10 @@ def test_part_2():
     )
 
 
+def test_stream():
+    assert part_1(io.StringIO(get_example_input() + "\n")) == 13140
+
+
 @no_input_skip
 def test_part_1_real():
     real_input = read_input(__file__)
@@ -244,6 +267,15 @@ def test_part_2_real():
     )
 
 
+def test_generate():
+    generated = generate(250, seed=1)
+    # the register never leaves the screen, so no signal goes negative
+    assert 0 <= part_1(generated) == 7580
+    rows = part_2(generated).split("\n")[1:]
+    assert len(rows) >= 6
+    assert all(len(row) == SCREEN_WIDTH for row in rows[:-1])
+
+
 # -- Main
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 # Standard Library
 from collections import defaultdict
 from collections.abc import Callable
+from copy import deepcopy
 from math import lcm
+from random import Random
 from typing import Self
 
 # First Party
@@ -65,8 +67,12 @@ def get_monkey_business(monkeys: dict[int, Monkey]) -> int:
     return business[0] * business[1]
 
 
-def part_1(input: str) -> int:
-    monkeys = Monkey.parse(input)
+def parse(input: str) -> dict[int, Monkey]:
+    return Monkey.parse(input)
+
+
+def part_1(monkeys: dict[int, Monkey]) -> int:
+    monkeys = deepcopy(monkeys)
     for _ in range(20):
         for monkey in monkeys.values():
             monkey.process_items(lambda x: x // 3)
@@ -74,8 +80,8 @@ def part_1(input: str) -> int:
     return get_monkey_business(monkeys)
 
 
-def part_2(input: str) -> int:
-    monkeys = Monkey.parse(input)
+def part_2(monkeys: dict[int, Monkey]) -> int:
+    monkeys = deepcopy(monkeys)
     base = lcm(*[monkey.test for monkey in monkeys.values()])
 
     for _ in range(10000):
@@ -85,6 +91,29 @@ def part_2(input: str) -> int:
     return get_monkey_business(monkeys)
 
 
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    size = max(size, 3)
+    monkeys = []
+    for i in range(size):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 5)))
+        operation = rng.choice([f"old * {rng.randint(2, 4)}", f"old + {rng.randint(1, 9)}"])
+        if_true, if_false = rng.sample([m for m in range(size) if m != i], 2)
+        monkeys.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {rng.choice(PRIMES)}\n"
+            f"    If true: throw to monkey {if_true}\n"
+            f"    If false: throw to monkey {if_false}"
+        )
+
+    return "\n\n".join(monkeys)
+
+
 # -- Tests
 
 
@@ -119,31 +148,38 @@ Monkey 3:
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 10605
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 2713310158
 
 
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 67830
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 15305381442
 
 
+def test_generate():
+    generated = generate(8, seed=1)
+    assert generated.count("Monkey ") == 8
+    assert part_1(parse(generated)) == 25122
+    assert part_2(parse(generated)) == 25541793088
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
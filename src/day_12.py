@@ -1,94 +1,69 @@
 # Standard Library
-from collections.abc import Callable, Iterable
-from dataclasses import dataclass
-from typing import Self
+from collections import deque
+from collections.abc import Callable
+from random import Random
 
 # First Party
 from utils import no_input_skip, read_input
+from utils.grid import Grid
 
 
-@dataclass(frozen=True)
-class Vec:
-    x: int
-    y: int
-
-    def __add__(self, delta: Self) -> Self:
-        return Vec(self.x + delta.x, self.y + delta.y)
-
-
-@dataclass(frozen=True)
-class Node:
-    pos: Vec
-    connected: list[Vec]
-
-
-def moves(curr: Vec) -> Iterable[Vec]:
-    for move in [Vec(0, -1), Vec(0, 1), Vec(-1, 0), Vec(1, 0)]:
-        yield move + curr
-
-
-def build_grid(input: str) -> tuple[Vec, Vec, dict[Vec, int]]:
-    grid: dict[Vec, int] = {}
-    start: Vec = Vec(-1, -1)
-    end: Vec = Vec(-1, -1)
-
-    for y, line in enumerate(input.split("\n")):
-        for x, col in enumerate(line):
-            match col:
-                case "S":
-                    start = Vec(x, y)
-                    grid[Vec(x, y)] = ord("a")
-                case "E":
-                    end = Vec(x, y)
-                    grid[Vec(x, y)] = ord("z")
-                case height:
-                    grid[Vec(x, y)] = ord(height)
+def parse(input: str) -> tuple[int, int, Grid]:
+    grid = Grid.parse(input)
+    start, end = grid.find(ord("S")), grid.find(ord("E"))
+    grid.cells[start] = ord("a")
+    grid.cells[end] = ord("z")
 
     return start, end, grid
 
 
-def path_find(nodes: dict[Vec, Node], start_point: Vec, end_condition: Callable[[Vec], bool]):
-    paths: list[list[Vec]] = [[start_point]]
-    visited: set[Vec] = set()
-    while len(paths):
-        path = paths.pop(0)
-        for curr in nodes[path[-1]].connected:
-            if end_condition(curr):
-                return path
+def path_find(grid: Grid, start_point: int, can_move: Callable[[int, int], bool], end_condition: Callable[[int], bool]) -> int:
+    cells = grid.cells
+    steps = {start_point: 0}
+    queue = deque([start_point])
 
-            if curr not in visited:
-                new_path = list(path)
-                new_path.append(curr)
-                paths.append(new_path)
-                visited.add(curr)
+    while len(queue):
+        curr = queue.popleft()
+        for new in grid.neighbours(curr):
+            if new in steps or not can_move(cells[curr], cells[new]):
+                continue
 
-    raise Exception(f"no path found: {len(visited)}")
+            if end_condition(new):
+                return steps[curr] + 1
 
+            steps[new] = steps[curr] + 1
+            queue.append(new)
 
-def part_1(input: str) -> int:
-    start, end, grid = build_grid(input)
+    raise Exception(f"no path found: {len(steps)}")
 
-    nodes: dict[Vec, Node] = {}
-    for pos in grid:
-        connected = [new for new in moves(pos) if new in grid and (grid[pos] + 1) >= grid[new]]
-        nodes[pos] = Node(pos=pos, connected=connected)
 
-    path = path_find(nodes, start, lambda c: c == end)
+def part_1(parsed: tuple[int, int, Grid]) -> int:
+    start, end, grid = parsed
+    return path_find(grid, start, lambda curr, new: curr + 1 >= new, lambda c: c == end)
 
-    return len(path)
 
+def part_2(parsed: tuple[int, int, Grid]) -> int:
+    _, end, grid = parsed
+    return path_find(grid, end, lambda curr, new: curr - 1 <= new, lambda c: grid.cells[c] == ord("a"))
 
-def part_2(input: str) -> int:
-    _, end, grid = build_grid(input)
 
-    nodes: dict[Vec, Node] = {}
-    for pos in grid:
-        connected = [new for new in moves(pos) if new in grid and (grid[pos] - 1) <= grid[new]]
-        nodes[pos] = Node(pos=pos, connected=connected)
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    size = max(size, 26)
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            height = min(25, (x + y) // 2)
+            if y > 0 and x < size - 1 and rng.random() < 0.2:
+                height = max(0, height - rng.randint(1, 3))
+            row.append(chr(ord("a") + height))
+        rows.append(row)
 
-    path = path_find(nodes, end, lambda c: grid[c] == ord("a"))
+    rows[0][0] = "S"
+    rows[-1][-1] = "E"
 
-    return len(path)
+    return "\n".join("".join(row) for row in rows)
 
 
 # -- Tests
@@ -103,31 +78,39 @@ abdefghi"""
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 31
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 29
 
 
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 468
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 459
 
 
+def test_generate():
+    generated = generate(30, seed=1)
+    # S and E are in opposite corners, so no path is shorter than the walk between them
+    assert part_1(parse(generated)) >= part_2(parse(generated)) >= 2 * 29 - 2
+    assert part_1(parse(generated)) == 58
+    assert part_2(parse(generated)) == 57
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
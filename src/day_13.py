@@ -1,12 +1,13 @@
 # Standard Library
 from functools import cmp_to_key
+from random import Random
 from typing import Literal
 
 # First Party
 from utils import no_input_skip, read_input
 
 
-def parse(packet_row: str):
+def parse_packet(packet_row: str):
     def p(packet: list):
         _packet = []
 
@@ -60,7 +61,7 @@ def compare(packet_1, packet_2) -> Literal[-1] | Literal[0] | Literal[1]:
 def part_1(input: str) -> int:
     correct = []
     for i, packet_pair in enumerate(input.split("\n\n")):
-        packet_1, packet_2 = list(map(parse, packet_pair.split("\n")))
+        packet_1, packet_2 = list(map(parse_packet, packet_pair.split("\n")))
         if compare(packet_1, packet_2) >= 0:
             correct.append(i + 1)
 
@@ -68,7 +69,7 @@ def part_1(input: str) -> int:
 
 
 def part_2(input: str) -> int:
-    packets = list(map(parse, filter(lambda x: x != "", input.split("\n"))))
+    packets = list(map(parse_packet, filter(lambda x: x != "", input.split("\n"))))
     packets.extend(([[2]], [[6]]))
 
     packets.sort(key=cmp_to_key(compare), reverse=True)
@@ -76,6 +77,20 @@ def part_2(input: str) -> int:
     return (packets.index([[2]]) + 1) * (packets.index([[6]]) + 1)
 
 
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+
+    def packet(depth: int = 0) -> list:
+        return [
+            packet(depth + 1) if depth < 3 and rng.random() < 0.25 else rng.randint(0, 10) for _ in range(rng.randint(0, 5))
+        ]
+
+    def row() -> str:
+        return str(packet()).replace(" ", "")
+
+    return "\n\n".join(f"{row()}\n{row()}" for _ in range(size))
+
+
 # -- Tests
 
 
@@ -108,7 +123,7 @@ def get_example_input() -> str:
 def test_parser():
     test_input = get_example_input()
     for row in filter(lambda x: x != "", test_input.split("\n")):
-        assert parse(row) == eval(row)
+        assert parse_packet(row) == eval(row)
 
 
 def test_part_1():
@@ -133,6 +148,14 @@ def test_part_2_real():
     assert part_2(real_input) == 25792
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    # the pair indices sum to at most 1 + 2 + ... + 50
+    assert 0 <= part_1(generated) <= 50 * 51 // 2
+    assert part_1(generated) == 656
+    assert part_2(generated) == 2660
+
+
 # -- Main
 
 if __name__ == "__main__":
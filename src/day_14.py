@@ -1,107 +1,126 @@
 # Standard Library
-from collections import defaultdict
-from collections.abc import Iterable
+from array import array
 from itertools import pairwise
-from typing import DefaultDict, Literal
+from math import isqrt
+from random import Random
 
 # First Party
 from utils import no_input_skip, read_input
+from utils.grid import Grid
 
 Point = tuple[int, int]
-ValidSimValues = Literal[".", "#", "o"]
-Sim = dict[Point, ValidSimValues]
 
+AIR, ROCK, SAND = ord("."), ord("#"), ord("o")
+START: Point = 500, 0
 
-def draw(sim: Sim) -> None:
-    x = list(map(lambda k: k[0], sim))
-    y = list(map(lambda k: k[1], sim))
-
-    def range_over(i: list[int], padding: int = 2) -> Iterable[int]:
-        return range(min(i) - padding, (max(i) + padding) + 1)
 
+def draw(grid: Grid) -> None:
+    sim = grid.copy()
+    sim[sim.width // 2, 0] = ord("+")
     print("---")
-    for _y in range_over(y):
-        for _x in range_over(x):
-            print("+" if (_x, _y) == START else sim[(_x, _y)], end="")
-        print()
+    print(sim)
     print("---")
 
 
-def step(sim: Sim, x: int, y: int, floor: int = 0) -> tuple[int, int]:
-    if y + 1 != floor:
-        if sim[(x, y + 1)] == ".":
-            return x, y + 1
-        elif sim[(x - 1, y + 1)] == ".":
-            return x - 1, y + 1
-        elif sim[(x + 1, y + 1)] == ".":
-            return x + 1, y + 1
-
-    return x, y
+def step(cells: array, width: int, i: int, limit: int) -> int:
+    below = i + width
+    if below < limit:
+        if cells[below] == AIR:
+            return below
+        elif cells[below - 1] == AIR:
+            return below - 1
+        elif cells[below + 1] == AIR:
+            return below + 1
 
-
-START: Point = 500, 0
+    return i
 
 
-def init_sim(input: str) -> tuple[Sim, int]:
-    sim: DefaultDict[Point, ValidSimValues] = defaultdict(lambda: ".")
+def parse(input: str) -> tuple[Grid, int]:
+    paths = [[tuple(map(int, point.split(","))) for point in row.split(" -> ")] for row in input.split("\n")]
+    max_y = max(y for path in paths for _, y in path)
+    floor = max_y + 2
 
-    for row in input.split("\n"):
-        points = row.split(" -> ")
+    # sand drifts at most one column per row, so nothing past the floor's depth either side of START matters
+    left = START[0] - floor - 1
+    grid = Grid(2 * floor + 3, floor + 1, AIR)
 
-        for p1, p2 in pairwise(points):
-            x1, y1 = map(int, p1.split(","))
-            x2, y2 = map(int, p2.split(","))
+    def rock(x: int, y: int) -> None:
+        if (x - left, y) in grid:
+            grid[x - left, y] = ROCK
 
+    for path in paths:
+        for (x1, y1), (x2, y2) in pairwise(path):
             for i in range(min(x1, x2), max(x1, x2) + 1):
-                sim[(i, y1)] = "#"
+                rock(i, y1)
 
             for i in range(min(y1, y2), max(y1, y2) + 1):
-                sim[(x1, i)] = "#"
+                rock(x1, i)
 
-    return sim, max(map(lambda k: k[1], sim.keys()))
+    return grid, max_y
 
 
-def part_1(input: str) -> int:
-    sim, max_y = init_sim(input)
+def part_1(parsed: tuple[Grid, int]) -> int:
+    grid, max_y = parsed
+    cells, width = array("b", grid.cells), grid.width
+    start = grid.width // 2
+    abyss = (max_y + 1) * width
 
     sand = 0
-    px, py = START
+    position = start
 
     while True:
-        cx, cy = step(sim, px, py)
+        current = step(cells, width, position, len(cells))
 
-        if cy > max_y:
+        if current >= abyss:
             return sand
 
-        if cx == px and cy == py:
-            px, py = START
+        if current == position:
+            position = start
             sand += 1
-            sim[(cx, cy)] = "o"
+            cells[current] = SAND
         else:
-            px = cx
-            py = cy
+            position = current
 
 
-def part_2(input: str) -> int:
-    sim, max_y = init_sim(input)
+def part_2(parsed: tuple[Grid, int]) -> int:
+    grid, max_y = parsed
+    cells, width = array("b", grid.cells), grid.width
+    start = grid.width // 2
+    floor = (max_y + 2) * width
 
     sand = 1
-    px, py = START
-    floor = max_y + 2
+    position = start
 
     while True:
-        cx, cy = step(sim, px, py, floor)
+        current = step(cells, width, position, floor)
 
-        if (cx, cy) == START:
+        if current == start:
             return sand
 
-        if cx == px and cy == py:
-            px, py = START
+        if current == position:
+            position = start
             sand += 1
-            sim[(cx, cy)] = "o"
+            cells[current] = SAND
         else:
-            px = cx
-            py = cy
+            position = current
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    spread = 10 * max(1, isqrt(size))
+    lines = []
+    for _ in range(size):
+        x, y = rng.randint(500 - spread, 500 + spread), rng.randint(2, spread)
+        points = [(x, y)]
+        for turn in range(rng.randint(1, 3)):
+            if turn % 2:
+                y = max(2, y + rng.randint(-10, 10))
+            else:
+                x += rng.randint(-10, 10)
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+
+    return "\n".join(lines)
 
 
 # -- Tests
@@ -113,32 +132,40 @@ def get_example_input() -> str:
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 24
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 93
 
 
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 674
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 24958
 
 
+def test_generate():
+    generated = generate(20, seed=1)
+    # with a floor the sand has to fill everything it used to fall past
+    assert part_1(parse(generated)) < part_2(parse(generated))
+    assert part_1(parse(generated)) == 1
+    assert part_2(parse(generated)) == 901
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
 
-    # real_input = get_example_input()
+    # real_input = parse(get_example_input())
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
@@ -1,35 +1,28 @@
 # Standard Library
-import re
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Self
+from functools import cached_property
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import int_tuples, no_input_skip, read_input
+from utils.geometry import Point
 
 
-@dataclass(frozen=True)
-class Vec:
-    x: int
-    y: int
-
-    def __add__(self, delta: Self) -> Self:
-        return Vec(self.x + delta.x, self.y + delta.y)
-
-    def dist_to(self, other: Self) -> int:
-        return abs(self.x - other.x) + abs(self.y - other.y)
-
-    def is_in_range(self, max_pos: int, min_pos: int = 0) -> bool:
-        return min_pos < self.x < max_pos and min_pos < self.y < max_pos
+def is_in_range(point: Point, max_pos: int, min_pos: int = 0) -> bool:
+    return min_pos < point.x < max_pos and min_pos < point.y < max_pos
 
 
 @dataclass(frozen=True)
 class Sensor:
-    pos: Vec
-    beacon: Vec
+    pos: Point
+    beacon: Point
+
+    @cached_property
+    def radius(self) -> int:
+        return self.pos.manhattan(self.beacon)
 
     def __int__(self) -> int:
-        return self.pos.dist_to(self.beacon)
+        return self.radius
 
     def covers(self, row: int) -> set[int]:
         cover_x = int(self) - abs(self.pos.y - row)
@@ -39,28 +32,25 @@ class Sensor:
                 covered.add(self.pos.x + x)
         return covered
 
-    def __contains__(self, point: Vec) -> bool:
-        return int(self) >= self.pos.dist_to(point)
+    def __contains__(self, point: Point) -> bool:
+        return self.radius >= self.pos.manhattan(point)
 
-    def walk_edges(self) -> Iterable[Vec]:
+    def walk_edges(self) -> Iterable[Point]:
         sx = self.pos.x
         sy = self.pos.y
 
         for x in range(-1, int(self) + 1):
             y = (int(self) - 1) - x
 
-            yield Vec((sx + x) + 1, (sy + y) + 1)
-            yield Vec((sx - x) - 2, (sy - y) - 1)
-            yield Vec((sx + x) + 1, (sy - y) - 1)
-            yield Vec((sx - x) - 1, (sy + y) + 1)
+            yield Point((sx + x) + 1, (sy + y) + 1)
+            yield Point((sx - x) - 2, (sy - y) - 1)
+            yield Point((sx + x) + 1, (sy - y) - 1)
+            yield Point((sx - x) - 1, (sy + y) + 1)
 
 
 def get_sensors(input: str) -> Iterable[Sensor]:
-    regex = r"x=(-?\d+),\s+y=(-?\d+)"
-
-    for row in input.split("\n"):
-        matches = re.findall(regex, row, re.MULTILINE)
-        yield Sensor(Vec(*map(int, matches[0])), Vec(*map(int, matches[1])))
+    for sx, sy, bx, by in int_tuples(input, 4):
+        yield Sensor(Point(sx, sy), Point(bx, by))
 
 
 def part_1(input: str, test_row: int = 2000000) -> int:
@@ -81,7 +71,7 @@ def part_2(input: str, max_pos: int = 4000000) -> int:
 
     for i in range(len(sensors)):
         for e in sensors[i].walk_edges():
-            if e.is_in_range(max_pos) and all(e not in sensors[j] for j in range(i - 1, len(sensors))):
+            if is_in_range(e, max_pos) and all(e not in sensors[j] for j in range(i - 1, len(sensors))):
                 return (e.x * 4000000) + e.y
 
     raise Exception("Nothing found")
@@ -33,9 +33,7 @@ def add_to(opened: frozenset, new: str) -> frozenset:
     return frozenset(_opened)
 
 
-def part_1(input: str) -> int:
-    valves = parse(input)
-
+def part_1(valves: dict[str, Valve]) -> int:
     @cache
     def tick(mins: int, opened: frozenset, curr: str) -> int:
         if mins <= 0:
@@ -53,9 +51,7 @@ def part_1(input: str) -> int:
     return tick(30, frozenset(), "AA")
 
 
-def part_2(input: str) -> int:
-    valves = parse(input)
-
+def part_2(valves: dict[str, Valve]) -> int:
     @cache
     def tick(mins: int, opened: frozenset[str], curr: str, elephant: bool) -> int:
         if mins <= 0:
@@ -90,31 +86,31 @@ Valve JJ has flow rate=21; tunnel leads to valve II"""
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 1651
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 1707
 
 
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 1923
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 2594
 
 
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
@@ -1,60 +1,58 @@
 # Standard Library
-from collections import defaultdict
 from dataclasses import dataclass
-from typing import DefaultDict, Self
+from random import Random
 
 # First Party
 from utils import no_input_skip, read_input
+from utils.geometry import Packing, Point
 
+WIDTH = 7
+SPAWN_GAP = 4
 
-@dataclass(frozen=True)
-class Shape:
-    points: list[complex]
+PACKING = Packing(WIDTH)
 
-    def __add__(self, delta: complex) -> Self:
-        return Shape([p + delta for p in self.points])
+DOWN = PACKING.pack(0, -1)
+LEFT = PACKING.pack(-1, 0)
+RIGHT = PACKING.pack(1, 0)
 
-    def __contains__(self, pos: complex) -> bool:
-        return pos in self.points
 
-    @property
-    def left(self) -> int:
-        return min(int(p.real) for p in self.points)
+@dataclass(frozen=True)
+class Shape:
+    points: list[Point]
 
     @property
-    def right(self) -> int:
-        return max(int(p.real) for p in self.points)
+    def width(self) -> int:
+        return max(p.x for p in self.points) + 1
 
     @property
-    def bottom(self) -> int:
-        return min(int(p.imag) for p in self.points)
+    def height(self) -> int:
+        return max(p.y for p in self.points) + 1
 
     @property
-    def top(self) -> int:
-        return max(int(p.imag) for p in self.points)
-
-
-SPAWN_GAP = 4
+    def cells(self) -> tuple[int, ...]:
+        return PACKING.deltas(self.points)
 
-DOWN = complex(0, -1)
-LEFT = complex(-1, 0)
-RIGHT = complex(1, 0)
 
 SHAPES = [
-    Shape([complex(0, 0), complex(1, 0), complex(2, 0), complex(3, 0)]),
-    Shape([complex(1, 0), complex(0, 1), complex(1, 1), complex(2, 1), complex(1, 2)]),
-    Shape([complex(0, 0), complex(1, 0), complex(2, 0), complex(2, 1), complex(2, 2)]),
-    Shape([complex(0, 0), complex(0, 1), complex(0, 2), complex(0, 3)]),
-    Shape([complex(0, 0), complex(0, 1), complex(1, 0), complex(1, 1)]),
+    Shape([Point(0, 0), Point(1, 0), Point(2, 0), Point(3, 0)]),
+    Shape([Point(1, 0), Point(0, 1), Point(1, 1), Point(2, 1), Point(1, 2)]),
+    Shape([Point(0, 0), Point(1, 0), Point(2, 0), Point(2, 1), Point(2, 2)]),
+    Shape([Point(0, 0), Point(0, 1), Point(0, 2), Point(0, 3)]),
+    Shape([Point(0, 0), Point(0, 1), Point(1, 0), Point(1, 1)]),
 ]
 
 
 class Game:
-    def __init__(self, jets: list[complex], shapes: list[Shape]) -> None:
-        self.board: DefaultDict[complex, str] = defaultdict(lambda: ".")
-        self.jets: list[complex] = jets
+    def __init__(self, jets: list[int], shapes: list[Shape]) -> None:
+        self.board: set[int] = set()
+        self.jets: list[int] = jets
         self.shapes: list[Shape] = shapes
-        self.rock: Shape | None = None
+        self.cells: list[tuple[int, ...]] = [shape.cells for shape in shapes]
+        self.widths: list[int] = [shape.width for shape in shapes]
+        self.heights: list[int] = [shape.height for shape in shapes]
+        self.rock: int | None = None
+        self.rock_x: int = 0
+        self.rock_shape: int = 0
         self.rock_idx: int = 0
         self.jet_idx: int = 0
         self.spawn: int = SPAWN_GAP
@@ -65,39 +63,42 @@ class Game:
 
     def init_rock(self) -> bool:
         if self.rock is None:
-            self.rock = self.shapes[self.rock_idx % len(self.shapes)] + complex(2, self.spawn)
+            self.rock_shape = self.rock_idx % len(self.shapes)
+            self.rock, self.rock_x = PACKING.pack(2, self.spawn), 2
             self.rock_idx += 1
             return True
         return False
 
+    def collides(self, rock: int) -> bool:
+        board = self.board
+        return any(rock + cell in board for cell in self.cells[self.rock_shape])
+
     def move(self):
         if self.rock is None:
             raise Exception("No rock to move down")
 
         m = self.jets[self.jet_idx % len(self.jets)]
         self.jet_idx += 1
-        rock = self.rock + m
 
         self.last_jet = "left" if m == LEFT else "right"
 
-        if any(r in self.board for r in rock.points):
-            return
-
-        if rock.left >= 0 and rock.right <= 6:
-            self.rock = rock
+        # bounds first, a packed rock past the wall would wrap onto the next row
+        x = self.rock_x + m
+        if 0 <= x and x + self.widths[self.rock_shape] <= WIDTH and not self.collides(self.rock + m):
+            self.rock, self.rock_x = self.rock + m, x
 
     def down(self):
         if self.rock is None:
             raise Exception("No rock to move down")
 
         rock = self.rock + DOWN
-        if any(r in self.board for r in rock.points) or rock.bottom == 0:
-            for r in self.rock.points:
-                self.board[r] = "#"
-            self.spawn = max(self.spawn, self.rock.top + SPAWN_GAP)
+        if rock < WIDTH or self.collides(rock):
+            self.board.update(self.rock + cell for cell in self.cells[self.rock_shape])
+            top = self.rock // WIDTH + self.heights[self.rock_shape] - 1
+            self.spawn = max(self.spawn, top + SPAWN_GAP)
             self.rock = None
         else:
-            self.rock += DOWN
+            self.rock = rock
 
     def round(self):
 
@@ -117,7 +118,7 @@ class Game:
             key = (
                 self.rock_idx % len(self.shapes),
                 self.jet_idx % len(self.jets),
-                "".join([self.board.get(complex(i, self.height), " ") for i in range(7)]),
+                "".join(["#" if PACKING.pack(i, self.height) in self.board else " " for i in range(WIDTH)]),
             )
 
             if key in cache and rocks > 5022:
@@ -142,6 +143,11 @@ def part_2(input_string: str) -> int:
     return game.play(1000000000000)
 
 
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    return "".join(rng.choices("<>", k=size))
+
+
 # -- Tests
 
 
@@ -176,6 +182,14 @@ def test_part_1_real():
 #    assert ans == 1532183908048
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    # every rock adds at least one row and at most four
+    assert 2022 <= part_1(generated) <= 2022 * 4
+    assert part_1(generated) == 3146
+    assert part_2(generated) == 1999999999981
+
+
 # -- Main
 
 if __name__ == "__main__":
@@ -1,167 +1,111 @@
 # Standard Library
-from collections.abc import Iterable
-from dataclasses import dataclass
-from functools import cached_property, partial
-from typing import Self
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import int_tuples, no_input_skip, read_input
+from utils.geometry import FACES, Packing
 
+Cube = tuple[int, int, int]
 
-@dataclass(frozen=True)
-class Cube:
-    x: int
-    y: int
-    z: int
+AIR, LAVA, STEAM, EDGE = range(4)
 
-    def __add__(self, delta: Self) -> Self:
-        return Cube(
-            self.x + delta.x,
-            self.y + delta.y,
-            self.z + delta.z,
-        )
 
-    def __str__(self):
-        return f"{self.x}, {self.y}, {self.z}"
+def frame(cubes: list[Cube], padding: int) -> tuple[Cube, Cube]:
+    # the lowest corner and size of a box around the cubes, each axis sized on its own
+    low = tuple(min(axis) - padding for axis in zip(*cubes))
+    size = tuple(max(axis) - start + padding + 1 for axis, start in zip(zip(*cubes), low))
+    return low, size  # type: ignore[return-value]
 
-    def sum(self) -> int:
-        return self.x + self.y + self.z
 
-    def adj(self) -> Iterable[Self]:
-        yield Cube(self.x + 1, self.y + 0, self.z + 0)
-        yield Cube(self.x - 1, self.y + 0, self.z + 0)
+class Droplet:
+    def __init__(self, cubes: list[Cube]) -> None:
+        # two layers around the cubes, air for the steam to flow through and an edge to stop it
+        self.low, self.size = frame(cubes, 2)
+        width, height, depth = self.size
+        self.packing = Packing(width, height)
+        self.deltas = self.packing.deltas(FACES)
 
-        yield Cube(self.x + 0, self.y + 1, self.z + 0)
-        yield Cube(self.x + 0, self.y - 1, self.z + 0)
+        plane = width * height
+        self.cells = bytearray(plane * depth)
+        edge = bytes([EDGE])
+        self.cells[:plane] = edge * plane
+        self.cells[-plane:] = edge * plane
+        for z in range(0, len(self.cells), plane):
+            self.cells[z : z + width] = edge * width
+            self.cells[z + plane - width : z + plane] = edge * width
+        self.cells[::width] = edge * (height * depth)
+        self.cells[width - 1 :: width] = edge * (height * depth)
 
-        yield Cube(self.x + 0, self.y + 0, self.z + 1)
-        yield Cube(self.x + 0, self.y + 0, self.z - 1)
+        self.lava = [self.pack(cube) for cube in cubes]
+        for i in self.lava:
+            self.cells[i] = LAVA
 
+        self.steamed = False
 
-@dataclass(frozen=True)
-class Bounds:
-    x: list[int]
-    y: list[int]
-    z: list[int]
+    def __contains__(self, cube: Cube) -> bool:
+        return all(0 < c - low < size - 1 for c, low, size in zip(cube, self.low, self.size))
 
-    def __contains__(self, other: Cube):
-        return all(
-            [
-                self.min_x < other.x < self.max_x,
-                self.min_y < other.y < self.max_y,
-                self.min_z < other.z < self.max_z,
-            ]
-        )
+    def pack(self, cube: Cube) -> int:
+        return self.packing.pack(*(c - low for c, low in zip(cube, self.low)))
 
-    @cached_property
-    def volume(self) -> int:
-        return (self.max_x - self.min_x) * (self.max_y - self.min_y) * (self.max_z - self.min_z)
+    def steam(self) -> None:
+        if self.steamed:
+            return
 
-    @classmethod
-    def from_cubes(cls: type[Self], cubes: list[Cube]) -> Self:
-        xs = []
-        ys = []
-        zs = []
+        cells = self.cells
+        start = self.packing.pack(1, 1, 1)
+        cells[start] = STEAM
+        to_check = [start]
+        while to_check:
+            checking = to_check.pop()
+            for delta in self.deltas:
+                if cells[checking + delta] == AIR:
+                    cells[checking + delta] = STEAM
+                    to_check.append(checking + delta)
 
-        for cube in cubes:
-            xs.append(cube.x)
-            ys.append(cube.y)
-            zs.append(cube.z)
+        self.steamed = True
 
-        return cls(xs, ys, zs)
+    def faces(self, touching: int) -> int:
+        cells = self.cells
+        return sum(cells[i + delta] == touching for i in self.lava for delta in self.deltas)
 
-    @cached_property
-    def min_x(self) -> int:
-        return min(self.x)
 
-    @cached_property
-    def max_x(self) -> int:
-        return max(self.x)
+def parse(input: str) -> list[Cube]:
+    return int_tuples(input, 3)  # type: ignore[return-value]
 
-    @cached_property
-    def min_y(self) -> int:
-        return min(self.y)
 
-    @cached_property
-    def max_y(self) -> int:
-        return max(self.y)
+def part_1(cubes: list[Cube]) -> int:
+    low, (width, height, _) = frame(cubes, 1)
+    packing = Packing(width, height)
+    lava = {packing.pack(*(c - start for c, start in zip(cube, low))) for cube in cubes}
+    deltas = packing.deltas(FACES)
 
-    @cached_property
-    def min_z(self) -> int:
-        return min(self.z)
+    return sum(i + delta not in lava for i in lava for delta in deltas)
 
-    @cached_property
-    def max_z(self) -> int:
-        return max(self.z)
 
+def is_enclosed(cube: Cube, droplet: Droplet) -> bool:
+    if cube not in droplet:
+        return False
 
-def get_cubes(input: str) -> list[Cube]:
-    cubes: list[Cube] = []
-    for line in input.split("\n"):
-        cube = Cube(*map(int, line.split(",")))
-        cubes.append(cube)
-    return cubes
+    droplet.steam()
+    return droplet.cells[droplet.pack(cube)] == AIR
 
 
-def part_1(input: str) -> int:
-    cubes = get_cubes(input)
+def part_2(cubes: list[Cube]) -> int:
+    droplet = Droplet(cubes)
+    droplet.steam()
 
-    faces = 0
-    for cube in cubes:
-        faces += 6
+    return droplet.faces(STEAM)
 
-        for adj in cube.adj():
-            if adj in cubes:
-                faces -= 1
 
-    return faces
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    side = max(3, round(size ** (1 / 3) * 1.5))
+    cubes: dict[tuple[int, int, int], None] = {}
+    while len(cubes) < min(size, side**3):
+        cubes[(rng.randint(1, side), rng.randint(1, side), rng.randint(1, side))] = None
 
-
-enclosed_cache: dict[Cube, bool] = {}
-
-
-def is_enclosed(cube: Cube, cubes: list[Cube], bounds: Bounds) -> bool:
-    to_check: list[Cube] = [cube]
-    checked: set[Cube] = set()
-
-    while len(to_check):
-        checking = to_check.pop(0)
-
-        if checking in enclosed_cache:
-            return enclosed_cache[checking]
-
-        checked.add(checking)
-
-        if checking not in bounds:
-            for c in checked:
-                enclosed_cache[c] = False
-            return False
-
-        for adj in checking.adj():
-            if adj not in checked and adj not in cubes and adj not in to_check:
-                to_check.append(adj)
-
-    for c in checked:
-        enclosed_cache[c] = True
-
-    return True
-
-
-def part_2(input: str) -> int:
-    cubes = get_cubes(input)
-    bounds = Bounds.from_cubes(cubes)
-
-    enclosed = partial(is_enclosed, cubes=cubes, bounds=bounds)
-
-    faces = 0
-    for cube in cubes:
-        faces += 6
-
-        for adj in cube.adj():
-            if adj in cubes or enclosed(adj):
-                faces -= 1
-
-    return faces
+    return "\n".join(f"{x},{y},{z}" for x, y, z in cubes)
 
 
 # -- Tests
@@ -184,41 +128,56 @@ def get_example_input() -> str:
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 64
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 58
 
 
 def test_bounds():
-    cubes = get_cubes(get_example_input())
-    bounds = Bounds.from_cubes(cubes)
+    droplet = Droplet(parse(get_example_input()))
+
+    assert is_enclosed((50, 50, 50), droplet) is False
+    assert is_enclosed((2, 2, 5), droplet) is True
+    assert is_enclosed((2, 2, 6), droplet) is False
 
-    enclosed = partial(is_enclosed, cubes=cubes, bounds=bounds)
 
-    cube = Cube(50, 50, 50)
-    assert enclosed(cube) is False
+def test_far_apart():
+    cubes = [(0, 0, 0), (150, 150, 150), (1, 0, 0)]
+    assert part_1(cubes) == 16
+    assert Droplet(cubes).size == (155, 155, 155)
+    assert Droplet([(0, 0, 0), (0, 0, 90)]).size == (5, 5, 95)
+    assert part_2([(0, 0, 0), (0, 0, 90)]) == 12
 
 
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 4604
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 2604
 
 
+def test_generate():
+    generated = generate(50, seed=1)
+    cubes = {tuple(map(int, line.split(","))) for line in generated.split("\n")}
+    assert len(cubes) == 50
+    touching = sum((x + dx, y + dy, z + dz) in cubes for x, y, z in cubes for dx, dy, dz in FACES)
+    assert part_1(parse(generated)) == 6 * 50 - touching == 248
+    assert part_2(parse(generated)) == 248
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
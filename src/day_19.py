@@ -97,7 +97,7 @@ class Sim:
         return self.resources[GEODE]
 
 
-def parse(line: str):
+def parse_blueprint(line: str):
     type_regex = r"Each (\w+)"
     cost_regex = r"(costs|and) (\d+) (\w+)"
 
@@ -131,7 +131,7 @@ def part_1(input: str) -> int:
     sims: list[dict[str, Robot]] = []
 
     for line in input.split("\n"):
-        sims.append(parse(line))
+        sims.append(parse_blueprint(line))
         break
 
     return sum(s.play() for s in sims)
@@ -1,9 +1,10 @@
 # Standard Library
 from collections import deque
 from collections.abc import Iterable
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import ints, no_input_skip, read_input
 
 
 def mix(numbers: deque[tuple[int, int]], rounds: int = 1) -> deque[tuple[int, int]]:
@@ -29,7 +30,7 @@ def grove_numbers(numbers: list[int]) -> list[int]:
 
 
 def intput_to_pairs(input: str, mul: int = 1) -> Iterable[tuple[int, int]]:
-    for i, n in enumerate(map(int, input.split("\n"))):
+    for i, n in enumerate(ints(input)):
         yield (n * mul, n * i)
 
 
@@ -51,6 +52,13 @@ def part_2(input: str) -> int:
     return sum(ans)
 
 
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    numbers = [rng.randint(-10000, 10000) or 1 for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return "\n".join(map(str, numbers))
+
+
 # -- Tests
 
 
@@ -86,6 +94,14 @@ def test_part_2_real():
     assert part_2(real_input) == 548634267428
 
 
+def test_generate():
+    # 97 numbers, with 50 the 1000th, 2000th and 3000th all land back on the 0
+    generated = generate(97, seed=1)
+    assert generated.split("\n").count("0") == 1
+    assert part_1(generated) == 8384
+    assert part_2(generated) == -6635552914928
+
+
 # -- Main
 
 if __name__ == "__main__":
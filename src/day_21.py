@@ -1,6 +1,7 @@
 # Standard Library
 import operator
 from collections.abc import Callable
+from random import Random
 
 # First Party
 from utils import no_input_skip, read_input
@@ -43,15 +44,13 @@ def parse(input: str) -> Monkeys:
     return monkeys
 
 
-def part_1(input: str) -> int:
-    monkeys = parse(input)
-
+def part_1(monkeys: Monkeys) -> int:
     ans, _ = resolve("root", monkeys)
     return ans
 
 
-def part_2(input: str) -> int:
-    monkeys = parse(input)
+def part_2(monkeys: Monkeys) -> int:
+    monkeys = dict(monkeys)
     root = monkeys["root"]
 
     if isinstance(root, int):
@@ -80,6 +79,59 @@ def part_2(input: str) -> int:
     return monkeys["humn"]
 
 
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    jobs: dict[str, str] = {}
+    values: dict[str, int] = {}
+
+    def name() -> str:
+        while (monkey := "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=4))) in jobs or monkey in ("root", "humn"):
+            pass
+        jobs[monkey] = ""
+        return monkey
+
+    def leaf(value: int) -> str:
+        monkey = name()
+        jobs[monkey], values[monkey] = str(value), value
+        return monkey
+
+    def tree(leaves: int) -> str:
+        if leaves == 1:
+            return leaf(rng.randint(1, 20))
+        split = rng.randint(1, leaves - 1)
+        left, right, monkey = tree(split), tree(leaves - split), name()
+        op = rng.choice("+-")
+        jobs[monkey] = f"{left} {op} {right}"
+        values[monkey] = values[left] + values[right] if op == "+" else values[left] - values[right]
+        return monkey
+
+    # humn only ever sits on the left of + - and a few * 2 so the part 2 search
+    # climbs monotonically and can't overshoot
+    human = rng.randint(1, 10)
+    jobs["humn"], chain, slope, offset, doubled = str(human), "humn", 1, 0, 0
+    for _ in range(min(max(size // 4, 1), 200)):
+        monkey = name()
+        if doubled < 4 and rng.random() < 0.1:
+            jobs[monkey] = f"{chain} * {leaf(2)}"
+            slope, offset, doubled = slope * 2, offset * 2, doubled + 1
+        else:
+            value = rng.randint(1, 20)
+            op = rng.choice("+-")
+            jobs[monkey] = f"{chain} {op} {leaf(value)}"
+            offset += value if op == "+" else -value
+        chain = monkey
+
+    other = tree(max((size - len(jobs)) // 2, 1))
+    adjusted = name()
+    target = slope * (human + rng.randint(1, 1000)) + offset
+    jobs[adjusted] = f"{other} + {leaf(target - values[other])}"
+    jobs["root"] = f"{chain} + {adjusted}"
+
+    lines = [f"{monkey}: {job}" for monkey, job in jobs.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -102,31 +154,40 @@ hmdt: 32"""
 
 
 def test_part_1():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_1(test_input) == 152
 
 
 def test_part_2():
-    test_input = get_example_input()
+    test_input = parse(get_example_input())
     assert part_2(test_input) == 301
 
 
 @no_input_skip
 def test_part_1_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_1(real_input) == 70674280581468
 
 
 @no_input_skip
 def test_part_2_real():
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
     assert part_2(real_input) == 3243420789721
 
 
+def test_generate():
+    generated = generate(100, seed=1)
+    assert len(generated.split("\n")) >= 100
+    # humn starts at 1-10 and the generator asks for 1-1000 more
+    assert 1 < part_2(parse(generated)) <= 1010
+    assert part_1(parse(generated)) == 1432
+    assert part_2(parse(generated)) == 207
+
+
 # -- Main
 
 if __name__ == "__main__":
-    real_input = read_input(__file__)
+    real_input = parse(read_input(__file__))
 
     print(f"Part1: {part_1(real_input)}")
     print(f"Part2: {part_2(real_input)}")
@@ -1,114 +1,50 @@
 # Standard Library
-from collections import defaultdict, deque
-from collections.abc import Callable, Iterator
-from dataclasses import dataclass
-from typing import DefaultDict, Deque, Literal, Self
+from collections import deque
+from typing import Deque, Literal
 
 # First Party
 from utils import no_input_skip, read_input  # noqa
+from utils.geometry import COMPASS, Point
+from utils.grid import Grid
 
 DIRECTIONS = (
     Literal["N"] | Literal["S"] | Literal["E"] | Literal["W"] | Literal["NE"] | Literal["NW"] | Literal["SE"] | Literal["SW"]
 )
 
+ELF, GROUND = ord("#"), ord(".")
 
-@dataclass(frozen=True)
-class Vec:
-    x: int
-    y: int
+dirs: dict[DIRECTIONS, Point] = COMPASS  # type: ignore[assignment]
 
-    def __add__(self, delta: Self) -> Self:
-        return Vec(self.x + delta.x, self.y + delta.y)
+Proposal = tuple[DIRECTIONS, tuple[DIRECTIONS, DIRECTIONS, DIRECTIONS]]
 
-    def __str__(self) -> str:
-        return f"x:{self.x}, y:{self.y}"
 
-
-dirs: dict[DIRECTIONS, Vec] = {
-    "N": Vec(0, -1),
-    "S": Vec(0, 1),
-    "E": Vec(1, 0),
-    "W": Vec(-1, 0),
-}
-
-dirs["NE"] = dirs["N"] + dirs["E"]
-dirs["NW"] = dirs["N"] + dirs["W"]
-dirs["SE"] = dirs["S"] + dirs["E"]
-dirs["SW"] = dirs["S"] + dirs["W"]
-
-
-def get_moves() -> Deque[Callable[[Vec, "Board"], Vec | None]]:
+def get_moves() -> Deque[Proposal]:
     return deque(
         [
-            lambda pos, board: pos + dirs["N"]
-            if all(board[pos + d] is None for d in [dirs["NW"], dirs["N"], dirs["NE"]])
-            else None,
-            lambda pos, board: pos + dirs["S"]
-            if all(board[pos + d] is None for d in [dirs["SW"], dirs["S"], dirs["SE"]])
-            else None,
-            lambda pos, board: pos + dirs["W"]
-            if all(board[pos + d] is None for d in [dirs["W"], dirs["NW"], dirs["SW"]])
-            else None,
-            lambda pos, board: pos + dirs["E"]
-            if all(board[pos + d] is None for d in [dirs["NE"], dirs["E"], dirs["SE"]])
-            else None,
+            ("N", ("NW", "N", "NE")),
+            ("S", ("SW", "S", "SE")),
+            ("W", ("W", "NW", "SW")),
+            ("E", ("NE", "E", "SE")),
         ]
     )
 
 
-@dataclass()
-class Elf:
-    pos: Vec
-    moves: Deque[Callable[[Vec, "Board"], Vec | None]]
-
-    def __str__(self) -> str:
-        return f"Elf at {self.pos}"
-
-
-class Board(DefaultDict):
-    @property
-    def min_x(self) -> int:
-        return min(vec.x for vec, c in self.items() if c is not None)
-
-    @property
-    def min_y(self) -> int:
-        return min(vec.y for vec, c in self.items() if c is not None)
-
-    @property
-    def max_x(self) -> int:
-        return max(vec.x for vec, c in self.items() if c is not None)
-
-    @property
-    def max_y(self) -> int:
-        return max(vec.y for vec, c in self.items() if c is not None)
-
-    @property
-    def area(self) -> int:
-        return (self.max_x - self.min_x) * (self.max_y - self.min_y)
-
-    def x_range(self, padding: int = 0) -> Iterator[int]:
-        yield from range(self.min_x - padding, self.max_x + 1 + padding)
-
-    def y_range(self, padding: int = 0) -> Iterator[int]:
-        yield from range(self.min_y - padding, self.max_y + 1 + padding)
-
-
-def get_board(elfs: list[Elf]) -> Board[Vec, Elf | None]:
-    board: DefaultDict[Vec, Elf | None] = Board(lambda: None)
+def parse_elfs(input: str, padding: int = 0) -> Grid:
+    return Grid.parse(input, fill=GROUND, padding=padding)
 
-    for elf in elfs:
-        board[elf.pos] = elf
 
-    return board
+def bounds(board: Grid) -> tuple[int, int, int, int]:
+    xs, ys = zip(*(board.position(i) for i, c in enumerate(board.cells) if c == ELF))
+    return min(xs), min(ys), max(xs), max(ys)
 
 
-def draw(elfs: list[Elf], padding: int = 0, extra: str = "") -> str:
-    board = get_board(elfs)
+def draw(board: Grid, padding: int = 0, extra: str = "") -> str:
+    min_x, min_y, max_x, max_y = bounds(board)
     print(f"=== {extra}")
     to_print = ""
-    for y in board.y_range(padding):
-        for x in board.x_range(padding):
-            to_print += "#" if board[Vec(x, y)] else "."
+    for y in range(min_y - padding, max_y + 1 + padding):
+        for x in range(min_x - padding, max_x + 1 + padding):
+            to_print += "#" if (x, y) in board and board[x, y] == ELF else "."
         to_print += "\n"
     print(to_print)
     print("===")
@@ -116,45 +52,46 @@ def draw(elfs: list[Elf], padding: int = 0, extra: str = "") -> str:
     return to_print
 
 
-def parse(input: str) -> Iterator[Elf]:
-    for y, line in enumerate(input.split("\n")):
-        for x, c in enumerate(line):
-            if c == "#":
-                yield Elf(Vec(x, y), get_moves())
+def move_elfs(board: Grid, moves: Deque[Proposal]) -> bool:
+    # the board needs a cell of padding per round so elfs never step off it
+    cells = board.cells
+    offsets = {name: board.offset(*delta) for name, delta in dirs.items()}
+    around = list(offsets.values())
 
+    proposed: dict[int, int] = {}
+    for elf in [i for i, c in enumerate(cells) if c == ELF]:
+        if all(cells[elf + o] != ELF for o in around):
+            continue
 
-def move_elfs(elfs: list[Elf]) -> list[Elf]:
-    board = get_board(elfs)
-    next_elfs: list[tuple[Vec, Elf]] = []
-    moves: DefaultDict[Vec, int] = defaultdict(lambda: 0)
-    for elf in elfs:
-        new_move = None
-        for move in elf.moves:
-            if new_move is None:
-                new_move = move(elf.pos, board)
+        for move, checks in moves:
+            if all(cells[elf + offsets[check]] != ELF for check in checks):
+                target = elf + offsets[move]
+                # -1 marks a square more than one elf wants
+                proposed[target] = -1 if target in proposed else elf
+                break
 
-        elf.moves.rotate(1)
-        if new_move is not None:
-            moves[new_move] += 1
-            next_elfs.append((new_move, elf))
+    moves.rotate(-1)
 
-    for new_move, elf in next_elfs:
-        if moves[new_move] == 1:
-            elf.pos = new_move
+    moved = False
+    for target, elf in proposed.items():
+        if elf != -1:
+            cells[elf], cells[target] = GROUND, ELF
+            moved = True
 
-    return elfs
+    return moved
 
 
 def part_1(input: str) -> int:
-    elfs: list[Elf] = list(parse(input))
+    rounds = 10
+    board = parse_elfs(input, rounds + 1)
+    moves = get_moves()
 
-    draw(elfs)
+    for _ in range(rounds):
+        move_elfs(board, moves)
 
-    for i in range(10):
-        elfs = move_elfs(elfs)
-        draw(elfs, extra=str(i + 1))
+    min_x, min_y, max_x, max_y = bounds(board)
 
-    return get_board(elfs).area - len(elfs)
+    return (max_x - min_x + 1) * (max_y - min_y + 1) - board.cells.count(ELF)
 
 
 def part_2(input: str) -> int:
@@ -187,8 +124,8 @@ def test_parse_and_draw():
 .##.
 ...."""
 
-    elfs = parse(start)
-    drawn = draw(list(elfs), 1)
+    elfs = parse_elfs(start, 1)
+    drawn = draw(elfs, 1)
     for left, right in zip(drawn.split("\n"), start.split("\n")):
         assert left == right
 
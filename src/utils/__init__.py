@@ -1,10 +1,16 @@
 # Standard Library
+import io
+import mmap
 import os
-from collections.abc import Iterable
+import re
+import warnings
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from functools import wraps
+from typing import Any
 
-# Third Party
-import pytest
+Buffer = str | bytes | mmap.mmap
+Input = Buffer | Iterable[str] | Iterable[bytes]
 
 
 def no_input_skip(f):
@@ -13,19 +19,170 @@ def no_input_skip(f):
         try:
             return f(*args, **kwargs)
         except FileNotFoundError:
+            # Third Party
+            import pytest
+
             pytest.skip("Input file not found")
 
     return wrapper
 
 
-def read_input(day: str) -> str:
+def input_path(day: str) -> str:
     file = os.path.splitext(os.path.basename(day))[0]
-    with open(os.path.join(os.path.dirname(__file__), "..", "..", "inputs", f"{file}.txt")) as f:
+    return os.path.join(os.path.dirname(__file__), "..", "..", "inputs", f"{file}.txt")
+
+
+def read_input(day: str) -> str:
+    with open(input_path(day)) as f:
         return f.read().rstrip().rstrip("\n\r")
 
 
+def read_input_buffer(day: str) -> mmap.mmap | bytes:
+    with open(input_path(day), "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be mapped
+            return b""
+
+
+def iter_lines(buffer: Buffer) -> Iterator:
+    newline, cr = ("\n", "\r") if isinstance(buffer, str) else (b"\n", b"\r")
+    end = len(buffer)
+    while end and buffer[end - 1 : end].isspace():
+        end -= 1
+
+    start = 0
+    while start < end:
+        stop = buffer.find(newline, start, end)
+        if stop == -1:
+            stop = end
+        yield buffer[start:stop].removesuffix(cr)
+        start = stop + 1
+
+
+def stream_lines(source: Iterable[str] | Iterable[bytes]) -> Iterator[str]:
+    blank: list[str] = []
+    for raw in source:
+        line = (raw.decode() if isinstance(raw, bytes) else raw).rstrip("\r\n")
+        if line.isspace() or not line:
+            # held back so trailing blank lines are dropped like read_input does
+            blank.append(line)
+            continue
+        yield from blank
+        blank.clear()
+        yield line
+
+
+def lines(input: Input) -> Iterator[str]:
+    if isinstance(input, str):
+        return iter_lines(input)
+    if isinstance(input, (bytes, mmap.mmap)):
+        return map(bytes.decode, iter_lines(input))
+    return stream_lines(input)
+
+
 def input_to_ints(input: str) -> list[int]:
-    return [int(x) for x in input.split("\n")]
+    return ints(input).tolist()
+
+
+INT_PATTERNS: dict[tuple[type, bool], re.Pattern] = {
+    (str, True): re.compile(r"-?\d+"),
+    (str, False): re.compile(r"\d+"),
+    (bytes, True): re.compile(rb"-?\d+"),
+    (bytes, False): re.compile(rb"\d+"),
+}
+
+# digits, newlines and "-" when signed survive, everything else becomes a space so split() finds the ints
+INT_BYTES = {
+    signed: bytes(c if 48 <= c <= 57 or c == 10 or (signed and c == 45) else 32 for c in range(256)) for signed in [True, False]
+}
+BLANK_LINE = re.compile(rb"\n *\n")
+
+
+INT_CHUNK = 1 << 20
+
+
+def int_bytes(input: Buffer, signed: bool) -> bytes | bytearray:
+    table = INT_BYTES[signed]
+    if isinstance(input, bytes):
+        return input.translate(table)
+
+    # a chunk at a time, so a str or mmap is only copied once, already translated
+    translated = bytearray()
+    for start in range(0, len(input), INT_CHUNK):
+        chunk = input[start : start + INT_CHUNK]
+        translated += (chunk.encode() if isinstance(chunk, str) else chunk).translate(table)
+
+    return translated
+
+
+def int_pattern(input: Buffer, signed: bool) -> re.Pattern:
+    return INT_PATTERNS[(str if isinstance(input, str) else bytes, signed)]
+
+
+def ints(input: Buffer, signed: bool = True) -> array:
+    # signed=False for inputs like "2-4" where the dash is a separator
+    try:
+        return array("q", map(int, int_bytes(input, signed).split()))
+    except ValueError:
+        # a dash that isn't a sign, only the regex can pull that apart
+        return array("q", map(int, int_pattern(input, signed).findall(input)))
+
+
+def int_group(group: bytes, signed: bool) -> list[int]:
+    # plain lists, an array per group costs more than it saves when groups are small
+    try:
+        return list(map(int, group.split()))
+    except ValueError:
+        return list(map(int, int_pattern(group, signed).findall(group)))
+
+
+def int_groups(input: Buffer, signed: bool = True) -> list[list[int]]:
+    # groups are split on lines without any ints on them
+    return [int_group(group, signed) for group in BLANK_LINE.split(int_bytes(input, signed).strip())]
+
+
+def iter_int_groups(input: Buffer, signed: bool = True) -> Iterator[list[int]]:
+    # the same groups one at a time, only the translated input is held rather than every group
+    data = int_bytes(input, signed).strip()
+    start = 0
+    for blank in BLANK_LINE.finditer(data):
+        yield int_group(data[start : blank.start()], signed)
+        start = blank.end()
+
+    yield int_group(data[start:], signed)
+
+
+def int_tuples(input: Buffer, size: int, signed: bool = True) -> list[tuple[int, ...]]:
+    numbers = ints(input, signed)
+    if len(numbers) % size:
+        raise ValueError(f"{len(numbers)} ints don't split into tuples of {size}")
+
+    return list(zip(*[iter(numbers)] * size))
+
+
+def ints_numpy(input: Buffer, signed: bool = True) -> Any:
+    # Third Party
+    import numpy
+
+    with warnings.catch_warnings():
+        # numpy only warns when it stops early on something it can't read
+        warnings.simplefilter("error")
+        try:
+            data = numpy.frombuffer(int_bytes(input, signed), dtype=numpy.uint8)
+            # fromstring only reads from read-only buffers
+            data.flags.writeable = False
+            return numpy.fromstring(data, dtype=numpy.int64, sep=" ")
+        except (DeprecationWarning, ValueError):
+            return as_numpy(ints(input, signed))
+
+
+def as_numpy(numbers: array) -> Any:
+    # Third Party
+    import numpy
+
+    return numpy.frombuffer(numbers, dtype=numpy.int64)
 
 
 def ints_to_input(ints: Iterable[int]) -> str:
@@ -56,19 +213,61 @@ ALPHABET = {
 }
 
 
-def ocr(input: dict[tuple[int, int], str]) -> str:
-    all_x, _ = zip(*input)
-    chars: str = ""
-    char_count = max(all_x) // 4
-    for i in range(char_count + 1):
-        char: str = ""
-        for y in range(6):
-            for x in range(4):
-                char += input[(x + (i * 5), y)]
-            char += "\n"
-        chars += ALPHABET[char.strip()]
+# maps "#" to "1" and every other byte to "0" so a row can go straight through int(..., 2)
+LIT = bytes(ord("1") if i == ord("#") else ord("0") for i in range(256))
 
-    return "".join(chars).strip()
+Screen = dict[tuple[int, int], str] | str | Sequence[str]
+
+
+def glyph_bits(rows: Sequence[int], column: int) -> int:
+    bits = 0
+    for row in rows:
+        bits = bits << 4 | (row >> column) & 0xF
+    return bits
+
+
+def row_masks(screen: Screen) -> tuple[list[int], int]:
+    if isinstance(screen, dict):
+        width = max(x for x, _ in screen) + 1
+        masks = [0] * (max(y for _, y in screen) + 1)
+        for (x, y), c in screen.items():
+            if c == "#":
+                masks[y] |= 1 << x
+        return masks, width
+
+    rows = screen.split("\n") if isinstance(screen, str) else screen
+    return [int(row.encode().translate(LIT)[::-1] or b"0", 2) for row in rows], max(map(len, rows))
+
+
+def ocr_numpy(screen) -> str:
+    # Third Party
+    import numpy
+
+    lit = numpy.asarray(screen).astype(bool)
+    height, width = lit.shape
+    lit = numpy.pad(lit, ((0, -height % 6), (0, -width % 5)))
+    # (bands, 6 rows, glyphs, 5 columns) with the gap column dropped
+    glyphs = lit.reshape(lit.shape[0] // 6, 6, lit.shape[1] // 5, 5)[..., :4]
+    weights = 1 << (numpy.arange(5, -1, -1)[:, None] * 4 + numpy.arange(4)[None, :])
+    codes = (glyphs * weights[None, :, None, :]).sum(axis=(1, 3))
+
+    return "\n".join("".join(GLYPHS[int(code)] for code in band).strip() for band in codes)
+
+
+GLYPHS: dict[int, str] = {glyph_bits(row_masks(glyph)[0], 0): letter for glyph, letter in ALPHABET.items()}
+
+
+def ocr(input: Screen) -> str:
+    if not isinstance(input, (dict, str, list, tuple)):
+        return ocr_numpy(input)
+
+    masks, width = row_masks(input)
+    bands = []
+    for top in range(0, len(masks), 6):
+        rows = masks[top : top + 6]
+        bands.append("".join(GLYPHS[glyph_bits(rows, column)] for column in range(0, width, 5)).strip())
+
+    return "\n".join(bands)
 
 
 # --- tests
@@ -83,11 +282,78 @@ def test_input_to_ints():
     assert input_to_ints(test_input) == [123, 456, 12]
 
 
+def test_ints():
+    assert list(ints("1\n-2\nx=3, y=-44")) == [1, -2, 3, -44]
+    assert list(ints(b"2-4,6-8", signed=False)) == [2, 4, 6, 8]
+    assert list(ints("2-4")) == [2, -4]
+    assert list(ints("")) == []
+
+
+def test_int_bytes_chunks(monkeypatch, tmp_path):
+    monkeypatch.setattr(__name__ + ".INT_CHUNK", 4)
+    assert int_bytes("x=12, y=-345\n6", True) == b"  12    -345\n6"
+
+    path = tmp_path / "ints.txt"
+    path.write_bytes(b"1,22\n\n-333,4444")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        assert int_groups(buffer) == [[1, 22], [-333, 4444]]
+
+
+def test_int_groups():
+    assert int_groups("1\n2\n\n3\n \n\n4\n\n") == [[1, 2], [3], [4]]
+    assert int_groups(b"-1\r\n\r\n2") == [[-1], [2]]
+    assert int_groups("1-2\n\n3") == [[1, -2], [3]]
+
+
+def test_iter_int_groups():
+    for input in ["1\n2\n\n3\n \n\n4\n\n", b"-1\r\n\r\n2", "1-2\n\n3", ""]:
+        assert list(iter_int_groups(input)) == int_groups(input)
+
+
+def test_ints_numpy():
+    # Third Party
+    import pytest
+
+    pytest.importorskip("numpy")
+
+    assert ints_numpy("1\n-2\nx=3, y=-44").tolist() == [1, -2, 3, -44]
+    assert ints_numpy("2-4,6-8", signed=False).tolist() == [2, 4, 6, 8]
+    assert ints_numpy("2-4").tolist() == [2, -4]
+
+
+def test_int_tuples():
+    # Third Party
+    import pytest
+
+    assert int_tuples("1,2,3\n4,5,6", 3) == [(1, 2, 3), (4, 5, 6)]
+    with pytest.raises(ValueError):
+        int_tuples("1,2", 3)
+
+
 def test_ints_to_input():
     ints = [123, 456, 12]
     assert ints_to_input(ints) == "123\n456\n12"
 
 
+def test_iter_lines():
+    assert list(iter_lines("1\r\n\n2\n\n")) == ["1", "", "2"]
+    assert list(iter_lines(b"1\n\n2")) == [b"1", b"", b"2"]
+    assert list(iter_lines("")) == []
+
+
+def test_lines_mmap(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"123\n456\n012\n")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        assert list(lines(buffer)) == ["123", "456", "012"]
+
+
+def test_lines_stream():
+    assert list(lines(io.StringIO("1\n\n2\n\n"))) == ["1", "", "2"]
+    assert list(lines(io.BytesIO(b"1\r\n2\r\n"))) == ["1", "2"]
+    assert list(lines(iter(["1", "", "2", " "]))) == ["1", "", "2"]
+
+
 def test_ocr_letters():
     for chars, letter in ALPHABET.items():
         grid: dict[tuple[int, int], str] = {}
@@ -97,6 +363,32 @@ def test_ocr_letters():
         assert ocr(grid) == letter
 
 
+def draw_screen(letters: str) -> str:
+    glyphs = [next(glyph for glyph, letter in ALPHABET.items() if letter == c).split("\n") for c in letters]
+    return "\n".join(" ".join(row).replace(".", " ") for row in zip(*glyphs))
+
+
+def test_ocr_screen():
+    screen = draw_screen("EFGH")
+
+    assert ocr(screen) == "EFGH"
+    assert ocr(screen.split("\n")) == "EFGH"
+    assert ocr(screen + "\n" + screen) == "EFGH\nEFGH"
+
+    grid = {(x, y): c for y, row in enumerate(screen.split("\n")) for x, c in enumerate(row)}
+    assert ocr(grid) == "EFGH"
+
+
+def test_ocr_numpy():
+    # Third Party
+    import pytest
+
+    numpy = pytest.importorskip("numpy")
+
+    lit = numpy.array([[c == "#" for c in row] for row in draw_screen("ZU").split("\n")])
+    assert ocr(lit) == "ZU"
+
+
 # def test_ocr_joined():
 #    grid: dict[tuple[int, int], str] = {}
 #    chars = zip(ALPHABET['A'].split("\n"), ALPHABET['B'].split("\n"))
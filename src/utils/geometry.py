@@ -0,0 +1,120 @@
+# Standard Library
+from collections.abc import Iterable, Iterator
+from typing import Self
+
+
+class Point:
+    # plain slots rather than a frozen dataclass, treat instances as immutable
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    def __add__(self, other: Self) -> Self:
+        return Point(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: Self) -> Self:
+        return Point(self.x - other.x, self.y - other.y)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Point) and self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __iter__(self) -> Iterator[int]:
+        yield self.x
+        yield self.y
+
+    def __repr__(self) -> str:
+        return f"Point({self.x}, {self.y})"
+
+    def manhattan(self, other: Self) -> int:
+        return abs(self.x - other.x) + abs(self.y - other.y)
+
+    def neighbours(self) -> Iterator[Self]:
+        for delta in ORTHOGONAL:
+            yield self + delta
+
+
+# y grows downwards, the way the puzzle inputs are drawn
+COMPASS: dict[str, Point] = {
+    "N": Point(0, -1),
+    "NE": Point(1, -1),
+    "E": Point(1, 0),
+    "SE": Point(1, 1),
+    "S": Point(0, 1),
+    "SW": Point(-1, 1),
+    "W": Point(-1, 0),
+    "NW": Point(-1, -1),
+}
+
+ORTHOGONAL: tuple[Point, ...] = tuple(COMPASS[d] for d in ["N", "E", "S", "W"])
+ADJACENT: tuple[Point, ...] = tuple(COMPASS.values())
+
+FACES: tuple[tuple[int, int, int], ...] = (
+    (1, 0, 0),
+    (-1, 0, 0),
+    (0, 1, 0),
+    (0, -1, 0),
+    (0, 0, 1),
+    (0, 0, -1),
+)
+
+
+class Packing:
+    # Packs coordinates into one int as x + y * width + z * width * height, so moving
+    # is a single int add and sets of points hash ints. Only the last axis is unbounded,
+    # the rest have to stay inside their size or they'll alias other points.
+    __slots__ = ("strides",)
+
+    def __init__(self, *sizes: int) -> None:
+        strides = [1]
+        for size in sizes:
+            strides.append(strides[-1] * size)
+        self.strides = tuple(strides)
+
+    def pack(self, *coords: int) -> int:
+        return sum(c * s for c, s in zip(coords, self.strides))
+
+    def unpack(self, packed: int) -> tuple[int, ...]:
+        coords = []
+        for stride in reversed(self.strides):
+            coord, packed = divmod(packed, stride)
+            coords.append(coord)
+
+        return tuple(reversed(coords))
+
+    def deltas(self, offsets: Iterable[Iterable[int]]) -> tuple[int, ...]:
+        return tuple(self.pack(*offset) for offset in offsets)
+
+
+# --- tests
+
+
+def test_point():
+    a, b = Point(1, 2), Point(3, -1)
+    assert a + b == Point(4, 1)
+    assert b - a == Point(2, -3)
+    assert a.manhattan(b) == 5
+    assert tuple(a) == (1, 2)
+    assert len({a, Point(1, 2), b}) == 2
+    assert a != (1, 2)
+
+
+def test_neighbours():
+    assert set(Point(0, 0).neighbours()) == {Point(0, -1), Point(1, 0), Point(0, 1), Point(-1, 0)}
+    assert len(set(ADJACENT)) == 8
+    assert sum(map(sum, FACES)) == 0
+
+
+def test_packing():
+    packing = Packing(7)
+    assert packing.pack(3, 2) == 17
+    assert packing.unpack(17) == (3, 2)
+    assert packing.pack(3, 2) + packing.pack(1, -1) == packing.pack(4, 1)
+
+    cube = Packing(5, 4)
+    assert cube.unpack(cube.pack(4, 3, 9)) == (4, 3, 9)
+    assert cube.deltas(FACES) == (1, -1, 5, -5, 20, -20)
@@ -0,0 +1,144 @@
+# Standard Library
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from importlib.util import find_spec
+from typing import Any, Self
+
+HAS_NUMPY = find_spec("numpy") is not None
+
+Point = tuple[int, int]
+
+# ascii digits to their values, so grids of digits parse with translate instead of a call per cell
+DIGITS = bytes((c - ord("0")) % 256 for c in range(256))
+
+
+class Grid:
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, fill: int = 0) -> None:
+        self.width = width
+        self.height = height
+        self.cells = array("b", [fill]) * (width * height)
+
+    @classmethod
+    def parse(cls, input: str, cell: Callable[[str], int] = ord, fill: int = ord(" "), padding: int = 0) -> Self:
+        rows = input.split("\n")
+        grid = cls(max(map(len, rows)) + 2 * padding, len(rows) + 2 * padding, fill)
+        for y, row in enumerate(rows, padding):
+            start = grid.index(padding, y)
+            grid.cells[start : start + len(row)] = array("b", cls.encode(row, cell))
+
+        return grid
+
+    @staticmethod
+    def encode(row: str, cell: Callable[[str], int]) -> Iterable[int]:
+        if cell is ord:
+            return row.encode()
+        if cell is int and row.isascii() and row.isdigit():
+            return row.encode().translate(DIGITS)
+        return map(cell, row)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def position(self, index: int) -> Point:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def offset(self, dx: int, dy: int) -> int:
+        return dy * self.width + dx
+
+    def __contains__(self, point: Point) -> bool:
+        x, y = point
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, point: Point) -> int:
+        return self.cells[self.index(*point)]
+
+    def __setitem__(self, point: Point, value: int) -> None:
+        self.cells[self.index(*point)] = value
+
+    def row(self, y: int) -> array:
+        return self.cells[y * self.width : (y + 1) * self.width]
+
+    def column(self, x: int) -> array:
+        return self.cells[x :: self.width]
+
+    def neighbours(self, index: int) -> Iterator[int]:
+        x = index % self.width
+        if index >= self.width:
+            yield index - self.width
+        if x + 1 < self.width:
+            yield index + 1
+        if index + self.width < len(self.cells):
+            yield index + self.width
+        if x:
+            yield index - 1
+
+    def find(self, value: int) -> int:
+        return self.cells.index(value)
+
+    def copy(self) -> Self:
+        grid = type(self)(self.width, self.height)
+        grid.cells = array("b", self.cells)
+        return grid
+
+    def view(self) -> Any:
+        # Third Party
+        import numpy
+
+        return numpy.frombuffer(self.cells, dtype=numpy.int8).reshape(self.height, self.width)
+
+    def __str__(self) -> str:
+        return "\n".join(self.row(y).tobytes().decode() for y in range(self.height))
+
+
+# --- tests
+
+
+def test_parse():
+    grid = Grid.parse("ab\nc", padding=1)
+    assert (grid.width, grid.height) == (4, 4)
+    assert str(grid) == "    \n ab \n c  \n    "
+    assert grid[1, 1] == ord("a") and grid[2, 1] == ord("b") and grid[1, 2] == ord("c")
+
+
+def test_parse_cells():
+    grid = Grid.parse("123\n45", int, fill=0)
+    assert list(grid.row(1)) == [4, 5, 0]
+    assert list(grid.column(2)) == [3, 0]
+    assert grid.find(5) == grid.index(1, 1)
+    assert grid.position(grid.index(2, 1)) == (2, 1)
+
+
+def test_parse_digits():
+    assert list(Grid.parse("09\n5", int, fill=0).cells) == [0, 9, 5, 0]
+    assert list(Grid.parse("12", lambda c: int(c) * 2).cells) == [2, 4]
+
+
+def test_bounds_and_neighbours():
+    grid = Grid(3, 2)
+    assert (2, 1) in grid and (3, 1) not in grid and (0, -1) not in grid
+    assert sorted(grid.neighbours(grid.index(0, 0))) == [1, 3]
+    assert sorted(grid.neighbours(grid.index(1, 1))) == [1, 3, 5]
+    assert grid.offset(1, 1) == 4
+
+
+def test_copy():
+    grid = Grid(2, 2)
+    copied = grid.copy()
+    copied[0, 0] = 1
+    assert grid[0, 0] == 0 and copied[0, 0] == 1
+
+
+def test_view():
+    # Third Party
+    import pytest
+
+    pytest.importorskip("numpy")
+
+    grid = Grid.parse("12\n34", int)
+    view = grid.view()
+    assert view.shape == (2, 2) and view[1, 0] == 3
+    view[0, 1] = 9
+    assert grid[1, 0] == 9